@@ -1,32 +1,30 @@
+import time                              # Import time for measuring startup
+STARTED = time.perf_counter()            # When the script began, for the startup report
 import tkinter as tk                     # Import the Tkinter GUI library
 from tkinter import messagebox           # Import messagebox for popup warnings
-import random                            # Import random for generating random numbers
 import os                                # Import os for building a safe path to the image
-from PIL import Image, ImageTk           # Import Pillow for image loading
+import sys                               # Import sys for printing the startup report
+from animation import FrameClock, ease_out  # One clock drives all animations
+from bg_cache import load_background     # Cached, pre-resized background (Pillow only on a miss)
+from quiz_session import (               # The game itself; this file is its Tk view
+    CORRECT, RETRY, DEFAULT_RULES, QuizSession
+)
 
 # ----------------- Game Settings & State -----------------
 
-TOTAL_QUESTIONS = 10                     # Total number of questions in a quiz
-POINTS_FIRST_TRY = 10                    # Points for a correct answer on first attempt
-POINTS_SECOND_TRY = 5                    # Points for a correct answer on second attempt
-MAX_SCORE = TOTAL_QUESTIONS * POINTS_FIRST_TRY  # Maximum possible score
+# Scoring rules (points, attempts, grade bounds) live in quiz_session.QuizRules
+TOTAL_QUESTIONS = DEFAULT_RULES.total_questions  # Total number of questions in a quiz
+QUIZ_SEED = None                         # Set to a number to get the same questions every time
+WINDOW_SIZE = (600, 480)                 # Window (and background image) size in pixels
+TIMING_ENV = "MATH_QUIZ_TIMING"          # Set to 1 to print startup times ("exit" also quits)
+SECONDS_PER_POINT = 0.03                 # Score count-up speed
+MAX_COUNT_UP = 0.6                       # Longest a count-up may take, in seconds
+FEEDBACK_FADE = 0.25                     # Seconds for feedback text to fade in
 
-score = 0                                # Actual game score
+session = None                           # The game being played (a QuizSession)
 displayed_score = 0                      # Score shown on screen (for animation)
-current_q = 0                            # Index of the current question (0-based)
-difficulty_level = 1                     # Current difficulty level (1=Easy, 2=Moderate, 3=Advanced)
-num1 = 0                                 # First operand in the math problem
-num2 = 0                                 # Second operand in the math problem
-operation = ''                           # Operation symbol ('+' or '-')
-attempt = 1                              # Current attempt number for this question
-max_attempts = 2                         # Maximum attempts allowed per question
-
-# Mapping for difficulty names (for display if needed later)
-difficulty_names = {
-    1: "Easy",
-    2: "Moderate",
-    3: "Advanced"
-}
+next_job = None                          # Pending after() id while the next question is coming
+max_attempts = DEFAULT_RULES.max_attempts  # Maximum attempts allowed per question
 
 # ----------------- Functions -----------------
 
@@ -44,55 +42,45 @@ def displayMenu():
         text=f"Q 0 / {TOTAL_QUESTIONS}"
     )                                   # Reset question progress label
 
-def randomInt(level):
-    """Return a random integer based on the chosen difficulty level."""
-    if level == 1:                      # Easy: single-digit numbers
-        return random.randint(0, 9)
-    elif level == 2:                    # Moderate: two-digit numbers
-        return random.randint(10, 99)
-    else:                               # Advanced: four-digit numbers
-        return random.randint(1000, 9999)
-
-def decideOperation():
-    """Randomly choose between addition and subtraction."""
-    return random.choice(['+', '-'])
-
-def isCorrect(user_ans, correct_ans):
-    """Check if the user's answer matches the correct answer."""
-    return user_ans == correct_ans
+def showScore(value):
+    """Put a (possibly mid-animation) score on the label."""
+    global displayed_score
+    displayed_score = int(value)
+    clock.set(score_value_label, text=str(displayed_score))
 
 def updateScoreLabel(animated=False):
     """
     Update the score label.
     If animated=True, smoothly count up to the new score.
     """
-    global displayed_score
+    score = session.score if session else 0
     if not animated:
-        displayed_score = score
-        score_value_label.config(text=str(displayed_score))
-    else:
-        if displayed_score < score:
-            displayed_score += 1
-            score_value_label.config(text=str(displayed_score))
-            root.after(30, lambda: updateScoreLabel(animated=True))
-
-def updateAttemptsLabel():
-    """Update the attempts left label based on the current attempt number."""
-    attempts_left = max_attempts - attempt + 1
+        clock.cancel("score")
+        showScore(score)
+    elif displayed_score < score:
+        # A count-up still running is replaced by one from where it got to
+        duration = min(MAX_COUNT_UP, SECONDS_PER_POINT * (score - displayed_score))
+        clock.animate("score", displayed_score, score, duration, showScore)
+
+def showFeedback(text, color):
+    """Show a feedback message, fading it in from the card colour."""
+    feedback_label.config(text=text)
+    clock.animate("feedback", "#ffffff", color, FEEDBACK_FADE,
+                  lambda c: clock.set(feedback_label, fg=c), ease=ease_out)
+
+def updateAttemptsLabel(attempts_left=None):
+    """Update the attempts left label (by default, for the session's current question)."""
+    if attempts_left is None: attempts_left = session.attempts_left
     attempts_label.config(text=f"Attempts Left: {attempts_left}")
 
 def updateProgressLabel():
     """Update the question progress label (e.g., Q 3 / 10)."""
-    shown_q = min(current_q + 1, TOTAL_QUESTIONS)
+    shown_q = min(session.current + 1, TOTAL_QUESTIONS)
     progress_label.config(text=f"Q {shown_q} / {TOTAL_QUESTIONS}")
 
-def startQuiz(level):
-    """Start the quiz at the chosen difficulty level."""
-    global difficulty_level, current_q, attempt, score
-    difficulty_level = level
-    current_q = 0
-    attempt = 1
-    score = 0
+def showQuiz():
+    """Switch to the quiz screen for a fresh session."""
+    cancelNext()
     menu_frame.pack_forget()
     result_frame.pack_forget()
     # Center quiz frame instead of filling everything
@@ -102,36 +90,45 @@ def startQuiz(level):
     updateProgressLabel()
     displayProblem()
 
+def startQuiz(level):
+    """Start the quiz at the chosen difficulty level."""
+    global session
+    session = QuizSession(level, seed=QUIZ_SEED)
+    showQuiz()
+
+def cancelNext():
+    """Forget a pending move to the next question (e.g. when leaving the quiz)."""
+    global next_job
+    if next_job: root.after_cancel(next_job); next_job = None
+
+def queueNext(delay):
+    """Show the next question (or the results) after delay ms."""
+    global next_job
+    next_job = root.after(delay, displayProblem)
+
 def displayProblem():
-    """Generate and display a new math problem or show results if quiz is done."""
-    global num1, num2, operation, attempt, current_q
-    if current_q >= TOTAL_QUESTIONS:
+    """Display the session's current problem, or show results if quiz is done."""
+    global next_job
+    next_job = None
+    if session.finished:
         displayResults()
         return
 
-    attempt = 1
-    num1 = randomInt(difficulty_level)
-    num2 = randomInt(difficulty_level)
-    operation = decideOperation()
-
-    if operation == '-' and num2 > num1:
-        num1, num2 = num2, num1
-
     problem_label.config(
-        text=f"Q{current_q + 1}:  {num1} {operation} {num2} ="
+        text=f"Q{session.current + 1}:  {session.problem()}"
     )
 
     answer_entry.delete(0, tk.END)
+    clock.cancel("feedback")
     feedback_label.config(text="")
     updateAttemptsLabel()
     updateProgressLabel()
     answer_entry.focus_set()
 
 def checkAnswer():
-    """Check the user's answer, update score, and control quiz flow."""
-    global score, current_q, attempt
-
-    if not quiz_frame.winfo_ismapped():
+    """Pass the user's answer to the session and show what happened."""
+    # Ignore Enter while the next question is on its way
+    if not quiz_frame.winfo_ismapped() or next_job:
         return
 
     try:
@@ -140,38 +137,20 @@ def checkAnswer():
         messagebox.showwarning("Invalid Input", "Please enter a number!")
         return
 
-    correct_ans = num1 + num2 if operation == '+' else num1 - num2
-
-    if isCorrect(user_ans, correct_ans):
-        points = POINTS_FIRST_TRY if attempt == 1 else POINTS_SECOND_TRY
-        score += points
+    outcome = session.answer(user_ans)
 
-        feedback_label.config(
-            text=f"✅ Correct! +{points} points",
-            fg="#2ecc71"
-        )
-
-        current_q += 1
+    if outcome.result == CORRECT:
+        showFeedback(f"✅ Correct! +{outcome.points} points", "#2ecc71")
         updateScoreLabel(animated=True)
-        quiz_frame.after(800, displayProblem)
+        queueNext(800)
+    elif outcome.result == RETRY:
+        showFeedback("❌ Incorrect! Try again.", "#e74c3c")
+        answer_entry.delete(0, tk.END)
+        updateAttemptsLabel()
     else:
-        if attempt < max_attempts:
-            feedback_label.config(
-                text="❌ Incorrect! Try again.",
-                fg="#e74c3c"
-            )
-            attempt += 1
-            answer_entry.delete(0, tk.END)
-            updateAttemptsLabel()
-        else:
-            feedback_label.config(
-                text=f"❌ Incorrect! The answer was {correct_ans}",
-                fg="#e74c3c"
-            )
-            current_q += 1
-            attempt = max_attempts
-            updateAttemptsLabel()
-            quiz_frame.after(1000, displayProblem)
+        showFeedback(f"❌ Incorrect! The answer was {outcome.answer}", "#e74c3c")
+        updateAttemptsLabel(1)          # Still on the last attempt until the next question shows
+        queueNext(1000)
 
 def displayResults():
     """Show the final score and grade after the quiz is finished."""
@@ -179,40 +158,39 @@ def displayResults():
     # Center result frame instead of full-screen
     result_frame.pack(expand=True)
 
-    result_label.config(text=f"Your Score: {score}/{MAX_SCORE}")
-
-    if score > 0.9 * MAX_SCORE:
-        grade = "A+"
-    elif score > 0.8 * MAX_SCORE:
-        grade = "A"
-    elif score > 0.7 * MAX_SCORE:
-        grade = "B+"
-    elif score > 0.6 * MAX_SCORE:
-        grade = "B"
-    else:
-        grade = "C"
-
-    grade_label.config(text=f"Grade: {grade}")
+    result_label.config(text=f"Your Score: {session.score}/{session.max_score}")
+    grade_label.config(text=f"Grade: {session.grade()}")
 
 def tryAgain():
     """Restart the quiz with the same difficulty."""
-    global current_q, attempt, score
-    current_q = 0
-    attempt = 1
-    score = 0
-    result_frame.pack_forget()
-    quiz_frame.pack(expand=True)
-    updateScoreLabel()
-    updateAttemptsLabel()
-    updateProgressLabel()
-    displayProblem()
+    session.restart(QUIZ_SEED)
+    showQuiz()
 
 def returnToMenu():
     """Go back to the main menu from any screen."""
+    cancelNext()
     result_frame.pack_forget()
     quiz_frame.pack_forget()
     displayMenu()
 
+def showBackground():
+    """Load the background after the first frame, so the window appears at once."""
+    image, cached = load_background(image_path, WINDOW_SIZE, root)
+    background_label.config(image=image)
+    background_label.image = image      # Keep a reference so Tk doesn't drop the image
+    timing = os.environ.get(TIMING_ENV)
+    if timing:
+        print(f"first frame {first_frame_ms:.1f} ms, background "
+              f"{(time.perf_counter() - STARTED) * 1000:.1f} ms "
+              f"({'cached' if cached else 'decoded with Pillow'})", file=sys.stderr)
+        if timing == "exit": root.after_idle(root.destroy)
+
+def afterFirstFrame():
+    """Runs once Tk has drawn the window; the background comes next."""
+    global first_frame_ms
+    first_frame_ms = (time.perf_counter() - STARTED) * 1000
+    root.after(1, showBackground)
+
 def quitGame():
     """Close the application."""
     root.destroy()
@@ -225,26 +203,24 @@ def on_enter_key(event):
 
 root = tk.Tk()
 root.title("🎨 Math Quiz")
-root.geometry("600x480")
+root.geometry(f"{WINDOW_SIZE[0]}x{WINDOW_SIZE[1]}")
 root.configure(bg="#f2f3f7")
 root.resizable(False, False)
 
 root.bind('<Return>', on_enter_key)
 
+clock = FrameClock(root)                 # Drives the score count-up and feedback fades
+
 # ----------------- Background Image -----------------
 
 # Build a safe absolute path to background.png in the SAME folder as this script
 script_dir = os.path.dirname(os.path.abspath(__file__))
 image_path = os.path.join(script_dir, "background.png")
 
-# Load with Pillow (handles PNG/JPG/etc.) and resize to window size
-bg_pil = Image.open(image_path)
-bg_pil = bg_pil.resize((600, 480), Image.LANCZOS)
-background_image = ImageTk.PhotoImage(bg_pil)
-
-background_label = tk.Label(root, image=background_image)
-background_label.image = background_image
+# The image itself is loaded by showBackground() once the window is up
+background_label = tk.Label(root, bg="#f2f3f7")
 background_label.place(x=0, y=0, relwidth=1, relheight=1)
+first_frame_ms = 0.0                     # Time to the first drawn frame, for the startup report
 
 # ----------------- Fonts -----------------
 
@@ -497,4 +473,7 @@ tk.Button(
 
 displayMenu()
 
+background_label.lower()                 # Keep the background behind every other widget
+# Idle callbacks are where Tk draws, so this runs just after the first frame
+root.after_idle(lambda: root.after(0, afterFirstFrame))
 root.mainloop()
@@ -0,0 +1,112 @@
+"""A frame clock that drives every animation in a Tk window.
+
+One FrameClock per window ticks at a steady rate while any tween is
+running, and not at all otherwise. Each tween works out its value from
+the time since it started, so a late frame just jumps ahead instead of
+slowing the animation down. Tweens change widgets through set(). set()
+only records the wanted options, and the clock applies each widget's
+changes with a single config() call at the end of the frame, leaving
+out options that already have that value. Starting a tween under a key that
+is already animating replaces the old one.
+"""
+import time
+
+FPS = 60
+
+
+def linear(t):
+    return t
+
+
+def ease_out(t):
+    return 1 - (1 - t) * (1 - t)
+
+
+def blend(c1, c2, t):
+    """Colour t of the way from "#rrggbb" c1 to c2."""
+    a = [int(c1[i:i + 2], 16) for i in (1, 3, 5)]
+    b = [int(c2[i:i + 2], 16) for i in (1, 3, 5)]
+    return "#" + "".join(f"{round(x + (y - x) * t):02x}" for x, y in zip(a, b))
+
+
+class Tween:
+    """Moves a value from start to end over duration seconds."""
+    __slots__ = ("start", "end", "duration", "apply", "done", "ease", "began")
+
+    def __init__(self, start, end, duration, apply, done, ease, began):
+        self.start = start
+        self.end = end
+        self.duration = duration
+        self.apply = apply
+        self.done = done
+        self.ease = ease
+        self.began = began
+
+    def value(self, now):
+        """(value at time now, True once the tween has reached its end)."""
+        t = 1.0 if self.duration <= 0 else min(1.0, (now - self.began) / self.duration)
+        if isinstance(self.start, str): return blend(self.start, self.end, self.ease(t)), t >= 1
+        return self.start + (self.end - self.start) * self.ease(t), t >= 1
+
+
+class FrameClock:
+    """Runs the tweens of one Tk window; see the module docstring."""
+    def __init__(self, root, fps=FPS):
+        self.root = root
+        self.interval = 1 / fps
+        self.tweens = {}   # key -> Tween
+        self.pending = {}  # widget -> options to apply this frame
+        self.job = None    # after() id of the next tick
+        self.next_frame = 0.0
+        self.frames = 0    # ticks run, for checking how busy the clock is
+
+    def animate(self, key, start, end, duration, apply, done=None, ease=linear):
+        """Start a tween; apply(value) runs every frame and done() once it finishes.
+
+        start and end are numbers, or "#rrggbb" colours. Any tween already
+        running under key is dropped without its done() being called.
+        """
+        now = time.perf_counter()
+        self.tweens[key] = Tween(start, end, duration, apply, done, ease, now)
+        if self.job is None:
+            self.next_frame = now
+            self.job = self.root.after_idle(self._tick)
+
+    def cancel(self, key):
+        """Stop the tween under key, if any, leaving its widgets as they are."""
+        self.tweens.pop(key, None)
+
+    def running(self, key):
+        return key in self.tweens
+
+    def set(self, widget, **options):
+        """Change widget options at the end of this frame (or straight away between frames)."""
+        self.pending.setdefault(widget, {}).update(options)
+        if self.job is None: self._flush()
+
+    def _flush(self):
+        pending, self.pending = self.pending, {}
+        for widget, options in pending.items():
+            changed = {k: v for k, v in options.items() if str(widget.cget(k)) != str(v)}
+            if changed: widget.config(**changed)
+
+    def _tick(self):
+        self.frames += 1
+        now = time.perf_counter()
+        finished = []
+        for key, tw in list(self.tweens.items()):
+            value, end = tw.value(now)
+            tw.apply(value)
+            if end: finished.append((key, tw))
+        for key, tw in finished:
+            if self.tweens.get(key) is tw: del self.tweens[key]
+        self._flush()
+        for _, tw in finished:
+            if tw.done: tw.done()
+        if not self.tweens:
+            self.job = None
+            return
+        # Aim at a fixed frame grid so pacing stays even when a tick runs late
+        self.next_frame += self.interval
+        if self.next_frame < now: self.next_frame = now + self.interval
+        self.job = self.root.after(max(1, round((self.next_frame - now) * 1000)), self._tick)
@@ -0,0 +1,63 @@
+"""On-disk cache of the Math Quiz background, already resized for the window.
+
+The first launch decodes background.png with Pillow, resizes it and saves
+the result as an uncompressed PPM in the user's cache folder. Later
+launches give that file straight to tk.PhotoImage, so Pillow is not even
+imported. The cache key is the source path, its mtime and the target
+size. Editing the image or changing the window size makes a new entry,
+and the old one is removed.
+"""
+import hashlib
+import os
+import tempfile
+import tkinter as tk
+
+CACHE_ENV = "MATH_QUIZ_CACHE"  # overrides the cache folder
+
+
+def cache_dir():
+    """Where resized images are kept: $MATH_QUIZ_CACHE, else the usual per-user cache folder."""
+    if os.environ.get(CACHE_ENV): return os.environ[CACHE_ENV]
+    base = (os.environ.get("XDG_CACHE_HOME") or os.environ.get("LOCALAPPDATA")
+            or os.path.join(os.path.expanduser("~"), ".cache"))
+    return os.path.join(base, "math_quiz")
+
+
+def cache_path(src, size):
+    """Cache file for src resized to size, named after src plus a hash of the key."""
+    src = os.path.abspath(src)
+    key = f"{src}|{os.stat(src).st_mtime_ns}|{size[0]}x{size[1]}"
+    stem = os.path.splitext(os.path.basename(src))[0]
+    return os.path.join(cache_dir(), f"{stem}-{hashlib.sha1(key.encode()).hexdigest()[:16]}.ppm")
+
+
+def _store(img, path):
+    # Written to a temp file and renamed, so a half-written entry is never read
+    folder = os.path.dirname(path)
+    os.makedirs(folder, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=folder, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f: img.save(f, "PPM")
+        os.replace(tmp, path)
+    except BaseException:
+        os.remove(tmp)
+        raise
+    # Drop entries for older versions (or other sizes) of the same image
+    stem = os.path.basename(path).rsplit("-", 1)[0] + "-"
+    for name in os.listdir(folder):
+        if name.startswith(stem) and name.endswith(".ppm") and name != os.path.basename(path):
+            try: os.remove(os.path.join(folder, name))
+            except OSError: pass
+
+
+def load_background(src, size, master=None):
+    """(PhotoImage of src resized to size, True if it came from the cache)."""
+    path = cache_path(src, size)
+    if os.path.exists(path):
+        try: return tk.PhotoImage(file=path, master=master), True
+        except tk.TclError: pass  # damaged entry; make it again
+    from PIL import Image, ImageTk  # only needed on a cache miss
+    img = Image.open(src).convert("RGB").resize(size, Image.LANCZOS)
+    try: _store(img, path)
+    except OSError: pass  # read-only or full disk: show the image anyway, uncached
+    return ImageTk.PhotoImage(img, master=master), False
@@ -0,0 +1,125 @@
+"""Batched, seedable question generation for the Math Quiz.
+
+make_quiz() builds every problem of a quiz in one go: both operands, the
+operator and the answer, kept in parallel typed arrays. Random numbers
+come from one randbytes() call per column. bytes.translate() maps them
+onto the level's range, dropping the few byte values that would make
+some numbers likelier than others. That leaves one short pass per column
+in Python, which is fast enough for millions of problems a second
+(practice sheets, load tests).
+
+The same (level, count, seed) always gives the same problems.
+
+    python questions.py --level 2 --count 1000000 --seed 7 > sheet.txt
+"""
+import argparse
+import random
+import sys
+from array import array
+from collections import namedtuple
+
+LEVELS = {1: (0, 9), 2: (10, 99), 3: (1000, 9999)}  # difficulty -> operand range
+OPERATORS = "+-"
+SHEET_CHUNK = 100_000  # problems written to a practice sheet at a time
+
+Question = namedtuple("Question", "num1 operation num2 answer")
+
+
+def _byte_table(span, offset):
+    """translate() table mapping a byte b to b % span + offset, and the bytes to drop."""
+    keep = 256 - 256 % span  # bytes at or above this would favour the low numbers
+    table = bytes((b % span + offset) % 256 for b in range(256))
+    return table, bytes(range(keep, 256))
+
+
+_TABLES = {}
+
+
+def uniform_bytes(rng, count, span, offset=0):
+    """count evenly spread numbers in offset .. offset + span - 1 (all under 256), as bytes."""
+    key = (span, offset)
+    if key not in _TABLES: _TABLES[key] = _byte_table(span, offset)
+    table, drop = _TABLES[key]
+    out = bytearray()
+    while len(out) < count:
+        need = count - len(out)
+        # Ask for a little more than the drop rate says is needed, so one call is nearly always enough
+        out += rng.randbytes(need * 256 // (256 - len(drop)) + 16).translate(table, drop)
+    del out[count:]
+    return out
+
+
+def operands(rng, level, count):
+    """count operands for a difficulty level."""
+    lo, hi = LEVELS[level]
+    if hi < 256: return uniform_bytes(rng, count, hi - lo + 1, lo)
+    # 1000-9999: a leading pair 10-99 and a trailing pair 00-99, both evenly spread
+    lead, tail = uniform_bytes(rng, count, 90, 10), uniform_bytes(rng, count, 100)
+    return [a * 100 + b for a, b in zip(lead, tail)]
+
+
+class QuestionBatch:
+    """A quiz's problems as parallel arrays; quiz[i] is a Question.
+
+    ops holds 0 for "+" and 1 for "-". A subtraction always has the
+    larger operand first, so no answer is negative.
+    """
+    __slots__ = ("level", "seed", "num1", "num2", "ops", "answers")
+
+    def __init__(self, level, seed, num1, num2, ops, answers):
+        self.level = level
+        self.seed = seed
+        self.num1 = num1
+        self.num2 = num2
+        self.ops = ops
+        self.answers = answers
+
+    def __len__(self):
+        return len(self.answers)
+
+    def __getitem__(self, i):
+        return Question(self.num1[i], OPERATORS[self.ops[i]], self.num2[i], self.answers[i])
+
+    def text(self, i):
+        """The problem as shown to the player, e.g. "45 + 9 =" """
+        return f"{self.num1[i]} {OPERATORS[self.ops[i]]} {self.num2[i]} ="
+
+    def lines(self, first=1):
+        """Practice-sheet lines "n. a + b = answer", numbered from first."""
+        return (f"{n}. {a} {OPERATORS[o]} {b} = {ans}\n"
+                for n, a, b, o, ans in zip(range(first, first + len(self)), self.num1,
+                                           self.num2, self.ops, self.answers))
+
+
+def make_quiz(level, count, seed=None):
+    """Build count problems for a difficulty level; seed=None picks (and records) a fresh seed."""
+    if level not in LEVELS: raise ValueError(f"unknown difficulty level {level!r}")
+    if seed is None: seed = random.randrange(1 << 32)
+    rng = random.Random(seed)
+    a, b = operands(rng, level, count), operands(rng, level, count)
+    ops = uniform_bytes(rng, count, 2)
+    # Subtractions put the larger number first; additions keep their order
+    num1 = [(x if x >= y else y) if o else x for x, y, o in zip(a, b, ops)]
+    num2 = [(y if x >= y else x) if o else y for x, y, o in zip(a, b, ops)]
+    answers = [x - y if o else x + y for x, y, o in zip(num1, num2, ops)]
+    return QuestionBatch(level, seed, array("H", num1), array("H", num2), bytes(ops),
+                         array("i", answers))
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Write a practice sheet of quiz problems with answers")
+    ap.add_argument("--level", type=int, choices=sorted(LEVELS), default=1)
+    ap.add_argument("--count", type=int, default=100)
+    ap.add_argument("--seed", type=int, help="same seed, same sheet (default: random)")
+    args = ap.parse_args(argv)
+    out = sys.stdout
+    seed = args.seed if args.seed is not None else random.randrange(1 << 32)
+    # Chunks keep memory flat for huge sheets; chunk k uses seed + k so any seed is reproducible
+    for k, start in enumerate(range(0, args.count, SHEET_CHUNK)):
+        n = min(SHEET_CHUNK, args.count - start)
+        out.writelines(make_quiz(args.level, n, seed + k).lines(start + 1))
+    print(f"# level {args.level}, seed {seed}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""Load generator for quiz_server.py: many simulated players at once.
+
+    python quiz_loadgen.py --port 8765 --clients 1000 --sessions 20000
+    python quiz_loadgen.py --spawn --clients 2000     (runs a server in-process)
+
+Each client keeps one connection open and plays whole quizzes on it, one
+after another, until --sessions have been played between them. Answers
+are worked out from the problem text, and --wrong of them are
+deliberately off by one. At most CONNECTING clients are between
+connect() and their first reply at a time, so a big --clients does not
+overflow the server's listen backlog. The report gives sessions per second and the
+p50/p99 time from sending an answer to getting its reply.
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from quiz_server import QuizServer
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+CONNECTING = 256  # clients allowed to be waiting on connect() and their first reply
+
+
+
+def solve(problem):
+    """The answer to "a + b =" or "a - b =" """
+    a, op, b, _ = problem.split()
+    return int(a) + int(b) if op == "+" else int(a) - int(b)
+
+
+def quantile(sorted_values, q):
+    if not sorted_values: return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+async def client(connect, gate, jobs, args, rnd, stats):
+    async with gate:
+        try: reader, writer = await connect()
+        except OSError as e:
+            stats["errors"].append(str(e) or type(e).__name__)
+            return
+        writer.write(b'{"op":"state"}\n')  # any reply means the server has accepted us
+        await writer.drain()
+        await reader.readline()
+
+    async def ask(req):
+        writer.write(json.dumps(req).encode() + b"\n")
+        await writer.drain()
+        reply = json.loads(await reader.readline())
+        if not reply.get("ok"): raise RuntimeError(reply.get("error"))
+        return reply
+
+    try:
+        while jobs:
+            jobs.pop()
+            reply = await ask({"op": "start", "level": args.level})
+            while not reply.get("finished"):
+                right = solve(reply["problem"])
+                t = time.perf_counter()
+                reply = await ask({"op": "answer",
+                                   "value": right + 1 if rnd.random() < args.wrong else right})
+                stats["latency"].append(time.perf_counter() - t)
+            stats["sessions"] += 1
+        writer.write(b'{"op":"quit"}\n')
+    except (ConnectionError, RuntimeError, ValueError) as e:
+        stats["errors"].append(str(e) or type(e).__name__)
+    finally:
+        writer.close()
+
+
+def raise_fd_limit(want):
+    # Every client is a socket (two with --spawn); the default limit is often 1024
+    if resource is None: return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < want:
+        target = want if hard == resource.RLIM_INFINITY else min(want, hard)
+        resource.setrlimit(resource.RLIMIT_NOFILE, (target, hard))
+
+
+async def run(args):
+    server = srv = None
+    if args.spawn:
+        server = QuizServer()
+        srv = await server.start(args.host, 0, args.unix)
+        if not args.unix: args.port = srv.sockets[0].getsockname()[1]
+    if args.unix: connect = lambda: asyncio.open_unix_connection(args.unix)
+    else: connect = lambda: asyncio.open_connection(args.host, args.port)
+
+    stats = {"sessions": 0, "latency": [], "errors": []}
+    jobs = list(range(args.sessions))
+    rnd = random.Random(args.seed)
+    gate = asyncio.Semaphore(CONNECTING)
+    t = time.perf_counter()
+    await asyncio.gather(*(client(connect, gate, jobs, args, random.Random(rnd.random()), stats)
+                           for _ in range(args.clients)))
+    elapsed = time.perf_counter() - t
+    if srv:
+        srv.close(); server.sweeper.cancel()
+        while server.active: await asyncio.sleep(0.01)  # let handlers see their clients hang up
+        await srv.wait_closed()
+
+    lat = sorted(stats["latency"])
+    print(f"clients={args.clients} sessions={stats['sessions']:,} answers={len(lat):,} "
+          f"in {elapsed:.2f}s")
+    print(f"  {stats['sessions'] / elapsed:10,.0f} sessions/s")
+    print(f"  {len(lat) / elapsed:10,.0f} answers/s")
+    print(f"  answer latency p50 {quantile(lat, .5) * 1e3:.2f} ms, "
+          f"p99 {quantile(lat, .99) * 1e3:.2f} ms")
+    if stats["errors"]:
+        print(f"  {len(stats['errors'])} client(s) failed, e.g. {stats['errors'][0]}")
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Simulate many Math Quiz players against quiz_server.py")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--unix", metavar="PATH", help="connect to (or with --spawn, serve on) a Unix socket")
+    ap.add_argument("--spawn", action="store_true", help="run the server in this process")
+    ap.add_argument("--clients", type=int, default=1000, help="connections open at once")
+    ap.add_argument("--sessions", type=int, default=10_000, help="quizzes to play in total")
+    ap.add_argument("--level", type=int, choices=(1, 2, 3), default=2)
+    ap.add_argument("--wrong", type=float, default=0.2, help="share of answers given wrong")
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args(argv)
+    raise_fd_limit(2 * args.clients + 64)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""Math Quiz server: a whole class playing from one process, over a local socket.
+
+Each connection plays QuizSessions (see quiz_session.py) one at a time,
+with one JSON object per line in each direction:
+
+    -> {"op": "start", "level": 2}                        ("seed" is optional)
+    <- {"ok": true, "question": 1, "total": 10, "problem": "45 + 9 =",
+        "attempts_left": 2, "score": 0}
+    -> {"op": "answer", "value": 54}
+    <- {"ok": true, "result": "correct", "points": 10, "answer": 54, "score": 10,
+        "question": 2, "total": 10, "problem": "...", "attempts_left": 2}
+    -> {"op": "state"}    the current question again
+    -> {"op": "quit"}     closes the connection
+
+"result" is "correct", "retry" (wrong, try again) or "wrong" (moved on;
+"answer" has the right one). The reply to the last answer has
+"finished": true, "grade" and "max_score" instead of a next problem.
+Errors come back as {"ok": false, "error": "..."} and the game carries
+on. There are three exceptions, and each one sends its error and then
+closes the connection:
+- a player idle for longer than --idle-timeout
+- a line longer than --max-line
+- a full server (--max-sessions)
+
+A connection's next line is not read while more than WRITE_BUFFER bytes
+of its replies are still waiting to be sent. So a client that stops
+reading stalls only itself, and is dropped after --write-timeout. Idle
+players are found by one sweep a second rather than a timer per read,
+which keeps the per-answer cost low with thousands connected.
+
+    python quiz_server.py --port 8765
+    python quiz_server.py --unix /tmp/math_quiz.sock
+"""
+import argparse
+import asyncio
+import json
+import os
+import time
+
+from questions import LEVELS
+from quiz_session import DEFAULT_RULES, QuizSession
+
+IDLE_TIMEOUT = 300.0   # seconds a player may take over one answer
+WRITE_TIMEOUT = 10.0   # seconds a reply may wait for the client to read it
+MAX_SESSIONS = 10_000  # connections served at once
+MAX_LINE = 4096        # bytes in one request line
+WRITE_BUFFER = 64 * 1024  # unsent reply bytes before a connection waits for its client
+SWEEP_EVERY = 1.0      # seconds between checks for idle players
+
+
+class QuizServer:
+    """Serves the quiz protocol above; start() it, then serve_forever() the result."""
+    def __init__(self, rules=DEFAULT_RULES, idle_timeout=IDLE_TIMEOUT,
+                 write_timeout=WRITE_TIMEOUT, max_sessions=MAX_SESSIONS, max_line=MAX_LINE):
+        self.rules = rules
+        self.idle_timeout = idle_timeout
+        self.write_timeout = write_timeout
+        self.max_sessions = max_sessions
+        self.max_line = max_line
+        self.seen = {}     # writer -> time of its last request, for every open connection
+        self.sweeper = None
+        self.started = 0   # sessions started
+        self.answers = 0
+        self.dropped = 0   # connections closed for a timeout, long line or full server
+
+    @property
+    def active(self):
+        return len(self.seen)
+
+    async def start(self, host="127.0.0.1", port=8765, path=None):
+        """Listen on a Unix socket at path, or on TCP host:port; returns the asyncio server."""
+        self.sweeper = asyncio.create_task(self._sweep())
+        if path:
+            if os.path.exists(path): os.remove(path)  # left over from an earlier run
+            return await asyncio.start_unix_server(self.handle, path, limit=self.max_line,
+                                                   backlog=1024)
+        return await asyncio.start_server(self.handle, host, port, limit=self.max_line,
+                                          backlog=1024)
+
+    async def _sweep(self):
+        # Close connections idle past idle_timeout; their pending readline() then sees EOF
+        while True:
+            await asyncio.sleep(min(SWEEP_EVERY, self.idle_timeout / 2))
+            cutoff = time.monotonic() - self.idle_timeout
+            for writer, seen in list(self.seen.items()):
+                if seen < cutoff and not writer.is_closing():
+                    self.dropped += 1
+                    writer.write(b'{"ok":false,"error":"timed out"}\n')
+                    writer.close()
+
+    # ---------------- Connections ----------------
+    async def handle(self, reader, writer):
+        if self.active >= self.max_sessions:
+            self.dropped += 1
+            await self._close(writer, {"ok": False, "error": "server busy"})
+            return
+        seen = self.seen
+        seen[writer] = time.monotonic()
+        session = None
+        try:
+            while True:
+                try: line = await reader.readline()
+                except ValueError:  # the line went past the stream's limit
+                    self.dropped += 1
+                    await self._close(writer, {"ok": False, "error": "line too long"})
+                    return
+                if not line or writer.is_closing(): break
+                seen[writer] = time.monotonic()
+                try: reply, session = self.dispatch(line, session)
+                except Exception as e:  # a bug in one request must not cost the player their game
+                    reply = {"ok": False, "error": f"server error: {type(e).__name__}"}
+                if reply is None: break
+                await self._send(writer, reply)
+        except (ConnectionError, asyncio.TimeoutError):
+            self.dropped += 1  # gone, or not reading its replies
+        finally:
+            del seen[writer]
+            writer.close()
+            try: await writer.wait_closed()
+            except ConnectionError: pass
+
+    async def _send(self, writer, reply):
+        writer.write(json.dumps(reply, separators=(",", ":")).encode() + b"\n")
+        if writer.transport.get_write_buffer_size() > WRITE_BUFFER:  # client not keeping up
+            await asyncio.wait_for(writer.drain(), self.write_timeout)
+
+    async def _close(self, writer, reply):
+        try: await self._send(writer, reply)
+        except (ConnectionError, asyncio.TimeoutError): pass
+        writer.close()
+
+    # ---------------- Requests ----------------
+    def dispatch(self, line, session):
+        """(reply, session) for one request line; reply is None to close the connection."""
+        try:
+            req = json.loads(line)
+            op = req["op"]
+            if not isinstance(op, str): raise TypeError
+        except (ValueError, TypeError, KeyError):
+            return {"ok": False, "error": "expected a JSON object with an \"op\""}, session
+        if op == "quit": return None, session
+        if op == "start":
+            level, seed = req.get("level", 1), req.get("seed")
+            if not isinstance(level, int) or isinstance(level, bool) or level not in LEVELS:
+                return {"ok": False, "error": "level must be 1, 2 or 3"}, session
+            if seed is not None and (not isinstance(seed, int) or isinstance(seed, bool)):
+                return {"ok": False, "error": "seed must be an integer"}, session
+            session = QuizSession(level, self.rules, seed)
+            self.started += 1
+            return self._question({"ok": True}, session), session
+        if session is None: return {"ok": False, "error": "send a \"start\" first"}, session
+        if op == "state": return self._question({"ok": True}, session), session
+        if op == "answer":
+            value = req.get("value")
+            if not isinstance(value, int) or isinstance(value, bool):
+                return {"ok": False, "error": "value must be an integer"}, session
+            if session.finished: return {"ok": False, "error": "the quiz is over"}, session
+            out = session.answer(value)
+            self.answers += 1
+            reply = {"ok": True, "result": out.result, "points": out.points, "answer": out.answer}
+            return self._question(reply, session), session
+        return {"ok": False, "error": f"unknown op {op!r}"}, session
+
+    def _question(self, reply, session):
+        # Add where the game is now: the next problem, or the final result
+        reply["score"] = session.score
+        if session.finished:
+            reply.update(finished=True, grade=session.grade(), max_score=session.max_score)
+        else:
+            reply.update(question=session.current + 1, total=session.rules.total_questions,
+                         problem=session.problem(), attempts_left=session.attempts_left)
+        return reply
+
+
+async def serve(args):
+    server = QuizServer(idle_timeout=args.idle_timeout, write_timeout=args.write_timeout,
+                        max_sessions=args.max_sessions)
+    srv = await server.start(args.host, args.port, args.unix)
+    where = args.unix or f"{args.host}:{args.port}"
+    print(f"Math Quiz server on {where} (Ctrl+C to stop)", flush=True)
+    try:
+        async with srv: await srv.serve_forever()
+    finally:
+        server.sweeper.cancel()
+        print(f"{server.started} session(s), {server.answers} answer(s), "
+              f"{server.dropped} connection(s) dropped", flush=True)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Serve the Math Quiz to many players over a local socket")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--unix", metavar="PATH", help="listen on a Unix socket instead of TCP")
+    ap.add_argument("--idle-timeout", type=float, default=IDLE_TIMEOUT)
+    ap.add_argument("--write-timeout", type=float, default=WRITE_TIMEOUT)
+    ap.add_argument("--max-sessions", type=int, default=MAX_SESSIONS)
+    args = ap.parse_args(argv)
+    try: asyncio.run(serve(args))
+    except KeyboardInterrupt: pass
+
+
+if __name__ == "__main__":
+    main()
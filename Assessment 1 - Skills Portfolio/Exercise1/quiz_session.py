@@ -0,0 +1,113 @@
+"""The Math Quiz game itself, with no UI.
+
+A QuizSession holds one player's quiz: its problems, which question they
+are on, how many attempts they have used and their score. answer() is
+the only move. The scoring rules are a QuizRules shared by every session
+that uses them, and sessions use __slots__, so one process can run
+thousands of games side by side (see QuizSession.many). Exercise1.py is
+a Tk view over a single session.
+"""
+from collections import namedtuple
+
+from questions import make_quiz
+
+TOTAL_QUESTIONS = 10                     # Total number of questions in a quiz
+POINTS_FIRST_TRY = 10                    # Points for a correct answer on first attempt
+POINTS_SECOND_TRY = 5                    # Points for a correct answer on second attempt
+MAX_ATTEMPTS = 2                         # Maximum attempts allowed per question
+# (grade, share of the maximum score it needs to beat), best first; anything else is a C
+GRADE_BOUNDS = (("A+", 0.9), ("A", 0.8), ("B+", 0.7), ("B", 0.6))
+LOWEST_GRADE = "C"
+
+QuizRules = namedtuple(
+    "QuizRules", "total_questions points_first_try points_second_try max_attempts grade_bounds",
+    defaults=(TOTAL_QUESTIONS, POINTS_FIRST_TRY, POINTS_SECOND_TRY, MAX_ATTEMPTS, GRADE_BOUNDS))
+DEFAULT_RULES = QuizRules()
+
+# What answer() did: "correct", "retry" (wrong, attempts left) or "wrong" (moved on)
+CORRECT, RETRY, WRONG = "correct", "retry", "wrong"
+Outcome = namedtuple("Outcome", "result points answer finished")
+
+
+class QuizSession:
+    """One game of the Math Quiz; see the module docstring.
+
+    The problems are questions[offset:offset + total_questions] of a
+    QuestionBatch, so many sessions can share one batch.
+    """
+    __slots__ = ("rules", "level", "questions", "offset", "current", "attempt", "score")
+
+    def __init__(self, level, rules=DEFAULT_RULES, seed=None, questions=None, offset=0):
+        self.rules = rules
+        self.level = level
+        self.questions = (questions if questions is not None
+                          else make_quiz(level, rules.total_questions, seed))
+        self.offset = offset
+        self.current = 0   # index of the current question (0-based)
+        self.attempt = 1   # attempt number at the current question
+        self.score = 0
+
+    @classmethod
+    def many(cls, level, count, rules=DEFAULT_RULES, seed=None):
+        """count sessions whose problems all come from one make_quiz() batch."""
+        n = rules.total_questions
+        batch = make_quiz(level, count * n, seed)
+        return [cls(level, rules, questions=batch, offset=i * n) for i in range(count)]
+
+    def restart(self, seed=None):
+        """Start again at the same level with new problems."""
+        self.questions = make_quiz(self.level, self.rules.total_questions, seed)
+        self.offset = self.current = self.score = 0
+        self.attempt = 1
+
+    # ---------------- State ----------------
+    @property
+    def finished(self):
+        return self.current >= self.rules.total_questions
+
+    @property
+    def max_score(self):
+        return self.rules.total_questions * self.rules.points_first_try
+
+    @property
+    def attempts_left(self):
+        return self.rules.max_attempts - self.attempt + 1
+
+    def problem(self):
+        """The current problem, e.g. "45 + 9 =" (None once finished)."""
+        return None if self.finished else self.questions.text(self.offset + self.current)
+
+    def correct_answer(self):
+        return None if self.finished else self.questions.answers[self.offset + self.current]
+
+    def grade(self):
+        score, top = self.score, self.max_score
+        for grade, share in self.rules.grade_bounds:
+            if score > share * top: return grade
+        return LOWEST_GRADE
+
+    # ---------------- Playing ----------------
+    def answer(self, value):
+        """Answer the current problem with an int; returns an Outcome.
+
+        Right first time scores points_first_try, on a later attempt
+        points_second_try. A wrong answer on the last attempt moves on
+        with no points.
+        """
+        if self.finished: raise ValueError("the quiz is over")
+        rules = self.rules
+        correct = self.questions.answers[self.offset + self.current]
+        if value == correct:
+            points = rules.points_first_try if self.attempt == 1 else rules.points_second_try
+            self.score += points
+            self._next()
+            return Outcome(CORRECT, points, correct, self.finished)
+        if self.attempt < rules.max_attempts:
+            self.attempt += 1
+            return Outcome(RETRY, 0, None, False)
+        self._next()
+        return Outcome(WRONG, 0, correct, self.finished)
+
+    def _next(self):
+        self.current += 1
+        self.attempt = 1
@@ -1,67 +1,868 @@
 import tkinter as tk
-from tkinter import messagebox
+from tkinter import filedialog, messagebox, ttk
+import argparse
+import atexit
+import math
 import os
+import sqlite3
+import sys
+import threading
+from collections import Counter, namedtuple
+from itertools import compress, islice
+
+from aggregates import TotalCounts, TotalsTracker
+from bulk_import import read_rows
+from columnar import ColumnarStore, grade_of, pct_of
+from instrument import ENV, Recorder
+from lazyfile import LazyStore
+from ordering import ORDER_KEYS, KeyedView, OrderedView, OrderIndex
+from parallel_load import iter_shards, shard_rows
+from saver import ERROR, PENDING, SAVED, SAVING, WriteBehind
+from search import SearchIndex
+from watcher import FileWatcher, appended_since, file_stamp, fingerprint
+
+# The Tk widgets are shared with the plain Exercise3 app (tk_widgets.py)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "Exercise3"))
+from tk_widgets import BackgroundLoader, VirtualList
 
 # ------------------ Student ------------------
 class Student:
+    """One student's marks.
+
+    Uses __slots__ and works out cw/total/pct/grade once, when the marks
+    are built (percentage and grade come from the tables in columnar.py).
+    A Student in a manager is read-only: to change marks, delete it and add
+    a new one so the index, totals and orderings stay in step.
+    """
+    __slots__ = ("code", "name", "c1", "c2", "c3", "exam", "_cw", "_total", "_pct", "_grade")
+
     def __init__(self, code, name, c1, c2, c3, exam):
         self.code = int(code)
         self.name = name
         self.c1 = int(c1); self.c2 = int(c2); self.c3 = int(c3)
         self.exam = int(exam)
+        self._derive()
 
-    def cw(self): return self.c1 + self.c2 + self.c3
-    def total(self): return self.cw() + self.exam
-    def pct(self): return round((self.total() / 160) * 100, 2)
+    def _derive(self):
+        self._cw = self.c1 + self.c2 + self.c3
+        self._total = t = self._cw + self.exam
+        self._pct = pct_of(t)
+        self._grade = grade_of(t)
 
-    def grade(self):
-        p = self.pct()
-        if p >= 70: return "A"
-        if p >= 60: return "B"
-        if p >= 50: return "C"
-        if p >= 40: return "D"
-        return "F"
+    def cw(self): return self._cw
+    def total(self): return self._total
+    def pct(self): return self._pct
+    def grade(self): return self._grade
 
     def to_line(self):
         return f"{self.code},{self.name},{self.c1},{self.c2},{self.c3},{self.exam}"
 
 # ------------------ Manager ------------------
+JOURNAL_LIMIT = 256 * 1024  # Journal size (bytes) that triggers a compaction
+SAVE_DELAY = 0.5  # Seconds of quiet before edits are saved in the background
+SAVE_POLL = 200   # ms between updates of the "saved" indicator
+PAGE_SIZE = 200  # Students per "View All" page
+CHUNK = 25       # Students rendered per idle callback
+BATCH_SIZE = 5000  # Students per batch when loading in the background
+TOP_DEFAULT = "10"  # Suggested answer in the "Top / Bottom" dialog
+IMPORT_SHOWN = 20  # Rejected rows listed in the import summary dialog
+SEARCH_DELAY = 120  # ms after the last keystroke before the list is filtered
+WATCH_POLL = 1000  # ms between checks of the marks file for outside changes
+DELETE_SINGLY = 32  # rows gone in one reload that are deleted one by one; more go in one pass
+
+# What reload() changed: file-order positions of rows edited in place, and
+# whether rows were added or removed (or everything was re-read)
+Delta = namedtuple("Delta", "rows resized")
+
 class StudentManager:
-    def __init__(self, path):
+    """Loads and saves students.
+
+    In journal mode, add/delete append a small record to "<path>.journal"
+    instead of rewriting the marks file. Once the journal passes
+    journal_limit bytes it is folded into a fresh snapshot on a background
+    thread. The snapshot keeps the plain studentMarks.txt format.
+
+    Otherwise, with save_delay set, edits are saved by a WriteBehind
+    thread (see saver.py) once they pause for that many seconds, so a
+    burst of edits costs one write. Without either, every edit saves the
+    whole file. Snapshots are always written to a temp file, fsynced and
+    renamed over the marks file.
+
+    With workers > 1 the marks file is parsed by that many processes
+    (see parallel_load.py).
+
+    reload() picks up changes another program made to the marks file,
+    applying only the rows that differ (see watcher.py).
+    """
+    def __init__(self, path, journal=False, journal_limit=JOURNAL_LIMIT, autoload=True,
+                 workers=1, save_delay=None):
         self.path = path
+        self.workers = workers
+        self.journal = journal
+        self.journal_limit = journal_limit
+        self.journal_path = path + ".journal"
+        self.lock = threading.Lock()
+        self.compactor = None
         self.students = []
-        self.load()
+        self.index = {}  # code -> Student, for O(1) lookups
+        self.dupes = {}  # code -> students with that code besides the one in index
+        self.totals = TotalsTracker()  # running average / highest / lowest
+        self.orders = {}  # sort key -> OrderIndex, kept up to date once built
+        self.order = (None, False)  # display order: (sort key or None, descending)
+        self.search = None  # SearchIndex over codes and names, built when loading ends
+        self.disk = None  # fingerprint of the marks file as last read or written
+        self.saver = (WriteBehind(self._save_behind, save_delay)
+                      if save_delay and not journal else None)
+        if autoload: self.load()
 
     def load(self):
         if not os.path.exists(self.path): open(self.path, "w").close()
+        self.disk = self._fingerprint()
+        self.search = None
+        self._read()
+        self.finish_load()
+
+    # ---------------- Background loading ----------------
+    def begin_load(self):
+        """Empty the manager before feeding it read_batches() via add_loaded()."""
+        if not os.path.exists(self.path): open(self.path, "w").close()
+        self.disk = self._fingerprint()
+        self._fill(())
+        self.search = SearchIndex()  # filled batch by batch, not all at the end
+
+    def read_batches(self, size=BATCH_SIZE):
+        """Yield (students, fraction done); only reads the file, so safe on a worker thread."""
+        if self.workers > 1:
+            for shard, frac in iter_shards(self.path, self.workers):
+                yield [Student(*r) for r in shard_rows(shard)], frac
+            return
+        total = os.path.getsize(self.path) or 1
+        done = 0
+        first = True
+        batch = []
+        with open(self.path, "rb") as f:
+            for raw in f:
+                done += len(raw)
+                ln = raw.decode("utf-8").strip()
+                if not ln: continue
+                if first:
+                    first = False
+                    if ln.isdigit(): continue  # count header
+                parts = ln.split(",")
+                if len(parts) == 6:
+                    batch.append(Student(*parts))
+                if len(batch) >= size:
+                    yield batch, done / total
+                    batch = []
+        yield batch, 1.0
+
+    def add_loaded(self, batch):
+        for s in batch:
+            self._add(s)
+
+    def finish_load(self):
+        if self.journal:
+            # A journal left over from an interrupted compaction comes first
+            for p in (self.journal_path + ".old", self.journal_path):
+                self._replay(p)
+        if self.search is None: self._build_search()
+
+    def _read(self):
+        if self.workers > 1:
+            self._fill(row for shard, _ in iter_shards(self.path, self.workers)
+                       for row in shard_rows(shard))
+            return
         with open(self.path, "r", encoding="utf-8") as f:
             lines = [l.strip() for l in f.readlines() if l.strip()]
         data = lines[1:] if lines and lines[0].isdigit() else lines
+        self._fill(ln.split(",") for ln in data)
+
+    def _fill(self, rows):
         st = []
-        for ln in data:
-            parts = ln.split(",")
+        for parts in rows:
             if len(parts) == 6:
                 st.append(Student(*parts))
         self.students = st
+        self.reindex()
+
+    def reindex(self):
+        # First occurrence wins, matching the old linear scan
+        self.index, self.dupes = {}, {}
+        for s in self.students:
+            self._index_add(s)
+        self.totals = TotalsTracker(self.students)
+        self.orders = {}
+        self.search = None
 
     def save(self):
-        with open(self.path, "w", encoding="utf-8") as f:
-            f.write(str(len(self.students)) + "\n")
-            for s in self.students:
-                f.write(s.to_line() + "\n")
+        if self.saver:
+            self.saver.mark(); self.saver.flush(); return
+        self._join_compactor()
+        with self.lock:
+            self._write_snapshot([s.to_line() for s in self.students])
+            if os.path.exists(self.journal_path): os.remove(self.journal_path)
 
     def by_code(self, code):
-        for s in self.students:
-            if s.code == code: return s
-        return None
+        return self.index.get(code)
+
+    # Edits hold the lock so a background save never copies a half-made change
+    def add(self, s):
+        with self.lock: self._add(s)
+        self._persist("+", s)
+
+    def add_many(self, students):
+        """Add a batch of students with one atomic rewrite of the marks file."""
+        with self.lock:
+            for s in students: self._add(s)
+        if self.saver: self.saver.mark()
+        else: self.save()
+
+    def delete(self, s):
+        code = s.code  # Columnar views go stale once their row is removed
+        with self.lock: self._delete(s)
+        self._persist("-", code)
+
+    # ---------------- Queries ----------------
+    def highest(self):
+        return self.totals.highest()
+
+    def lowest(self):
+        return self.totals.lowest()
+
+    def average_pct(self):
+        return self.totals.average_pct()
+
+    # ---------------- Ranks ----------------
+    def counts(self):
+        """TotalCounts for the class (see aggregates.py)."""
+        return self.totals.counts()
+
+    def rank(self, s):
+        """1 + the number of students with a higher total; equal totals share a rank."""
+        return self.counts().above(s.total()) + 1
+
+    def percentile(self, s):
+        """Percentage of the class with a lower total than s."""
+        c = self.counts()
+        return round(100 * c.below(s.total()) / c.count, 1) if c.count else 0.0
+
+    def top(self, k, lowest=False):
+        """The k highest (or lowest) students by total, best first; ties in file order."""
+        return self.totals.top(k, lowest)
+
+    def top_percent(self, p, lowest=False):
+        """The top (or bottom) p percent of the class, rounded up to a whole student."""
+        return self.top(math.ceil(self.counts().count * p / 100), lowest)
+
+    def ordered(self, by=None, reverse=False):
+        """Students in file order, or sorted by one of ORDER_KEYS.
+
+        The first request for a key builds its index; after that add and
+        delete keep it sorted, and descending is just a reversed view.
+        """
+        if by is None:
+            return OrderedView(self.students, reverse) if reverse else self.students
+        idx = self.orders.get(by)
+        if idx is None:
+            idx = self.orders[by] = OrderIndex(ORDER_KEYS[by], self.students)
+        return OrderedView(idx.items, reverse)
+
+    def set_order(self, by=None, reverse=False):
+        """Change the display order; the marks file is left as it is."""
+        self.order = (by, reverse)
+
+    @property
+    def display(self):
+        return self.ordered(*self.order)
+
+    def matching(self, text):
+        """Students whose name contains text or whose code starts with it (see search.py)."""
+        if self.search is None: self._build_search()
+        return KeyedView(self.search.find(text), self.by_code)
+
+    def _build_search(self):
+        self.search = SearchIndex(self.students)
+
+    def close(self):
+        """Write out pending edits, and fold any journal into the marks file (e.g. on quit)."""
+        if self.saver: self.saver.close()
+        if self.journal and (os.path.exists(self.journal_path)
+                             or os.path.exists(self.journal_path + ".old")):
+            self.save()
+        self._join_compactor()
+
+    # ---------------- Reloading ----------------
+    def reload(self):
+        """Catch up with changes another program made to the marks file.
+
+        Rows added at the end are parsed on their own. Any other change
+        is diffed against the students in memory (pending journal records
+        still win) and only the differing rows are replaced, added or
+        removed. Returns a Delta, or None if the file is as last seen.
+        Unsaved edits win: while a background save is due, nothing is
+        reloaded and the save overwrites the outside change.
+        """
+        if self.saver and self.saver.state != SAVED: return None
+        if file_stamp(self.path) in (None, self.disk and self.disk.stamp): return None
+        start = appended_since(self.path, self.disk)
+        self.disk = self._fingerprint()
+        if start is not None:
+            with open(self.path, "rb") as f:
+                f.seek(start)
+                new = [Student(*p) for p in (ln.decode("utf-8").strip().split(",") for ln in f)
+                       if len(p) == 6]
+            for s in new: self._add(s)
+            return Delta((), bool(new))
+        return self._apply_diff(self._target())
+
+    def _target(self):
+        """The rows, as to_line() strings, that loading from scratch would give now."""
+        if self.journal and any(os.path.exists(p) for p in
+                                (self.journal_path, self.journal_path + ".old")):
+            # Pending journal records have to be replayed over the new file
+            fresh = StudentManager(self.path, journal=True)
+            return [s.to_line() for s in fresh.students]
+        with open(self.path, "r", encoding="utf-8") as f:
+            lines = [l.strip() for l in f if l.strip()]
+        data = lines[1:] if lines and lines[0].isdigit() else lines
+        return [ln for ln in data if ln.count(",") == 5]
+
+    def _apply_diff(self, target):
+        cur = [s.to_line() for s in self.students]
+        old_set, new_set = set(cur), set(target)
+        if len(old_set) == len(cur) and len(new_set) == len(target):
+            # No repeated rows, so plain sets say what left and what arrived
+            gone = dict.fromkeys(old_set - new_set, 1)
+            extra = dict.fromkeys(new_set - old_set, 1)
+        else:
+            gone = Counter(cur); gone.subtract(target)
+            extra = Counter(target); extra.subtract(cur)
+        if sum(n for n in gone.values() if n > 0) + sum(n for n in extra.values() if n > 0) \
+                > len(target) // 4 + 16:
+            # Most of the file changed; reading it again is cheaper than patching
+            self.search = None
+            self._read()
+            self.finish_load()
+            return Delta((), True)
+        removed = []
+        for pos, (ln, s) in enumerate(zip(cur, self.students)):
+            if gone.get(ln, 0) > 0: gone[ln] -= 1; removed.append((pos, s))
+        added = {}  # code -> new rows, in file order
+        for ln in target:
+            if extra.get(ln, 0) > 0:
+                extra[ln] -= 1
+                s = Student(*ln.split(","))
+                added.setdefault(s.code, []).append(s)
+        # A row that left and came back with the same code was edited in place
+        edited, deleted = [], []
+        for pos, s in removed:
+            new = added.get(s.code)
+            if new: edited.append((pos, s, new.pop(0)))
+            else: deleted.append((pos, s))
+        for _, old, s in edited: self._replace(old, s)
+        if len(deleted) > DELETE_SINGLY:
+            self._delete_rows([pos for pos, _ in deleted])  # each _delete is O(n)
+        else:
+            for _, s in reversed(deleted): self._delete(s)  # last first, so row numbers hold
+        rest = [s for new in added.values() for s in new]
+        for s in rest: self._add(s)
+        if not (edited or deleted or rest): return None
+        return Delta([pos for pos, _, _ in edited], bool(deleted or rest))
+
+    def _fingerprint(self):
+        return fingerprint(self.path)
+
+    # ---------------- Internals ----------------
+    def _add(self, s):
+        # The search index goes first: its code array is the one thing that can refuse a code
+        if self.search is not None: self.search.add(s.code, s.name)
+        self.students.append(s)
+        self._index_add(s)
+        self.totals.add(s)
+        for idx in self.orders.values(): idx.add(s)
+
+    def _replace(self, old, s):
+        if self.search is not None:  # first, as in _add
+            self.search.add(s.code, s.name); self.search.remove(old.code, old.name)
+        self.students[self.students.index(old)] = s
+        if old.code != s.code:
+            self._index_remove(old); self._index_add(s)
+            if s.code in self.dupes:  # s may now come before the student indexed for its code
+                self.index[s.code] = next(o for o in self.students if o.code == s.code)
+        elif self.index.get(s.code) is old: self.index[s.code] = s
+        self.totals.remove(old); self.totals.add(s)
+        for idx in self.orders.values(): idx.remove(old); idx.add(s)
+
+    def _delete(self, s):
+        self.students.remove(s)
+        self.totals.remove(s)
+        for idx in self.orders.values(): idx.remove(s)
+        if self.search is not None: self.search.remove(s.code, s.name)
+        self._index_remove(s)
+
+    def _delete_rows(self, rows):
+        # Many deletes at once: rebuild the list without them and index it again
+        keep = bytearray(b"\1") * len(self.students)
+        for i in rows: keep[i] = 0
+        self.students = list(compress(self.students, keep))
+        self.reindex()
+
+    def _index_add(self, s):
+        if s.code in self.index: self.dupes[s.code] = self.dupes.get(s.code, 0) + 1
+        else: self.index[s.code] = s
+
+    def _index_remove(self, s):
+        # s has already left self.students
+        code = s.code
+        extra = self.dupes.get(code, 0)
+        if not extra:
+            if self.index.get(code) is s: del self.index[code]
+            return
+        if extra == 1: del self.dupes[code]
+        else: self.dupes[code] = extra - 1
+        if self.index.get(code) is s:
+            # Fall back to the next student with the same code; only scanned when one exists
+            self.index[code] = next(o for o in self.students if o.code == code)
+
+    def _persist(self, op, value):
+        # One edit: op "+" with the Student added, or "-" with the code deleted
+        if not self.journal:
+            if self.saver: self.saver.mark()
+            else: self.save()
+            return
+        record = f"+,{value.to_line()}" if op == "+" else f"-,{value}"
+        with self.lock:
+            with open(self.journal_path, "a", encoding="utf-8") as f:
+                f.write(record + "\n")
+            size = os.path.getsize(self.journal_path)
+        if size >= self.journal_limit:
+            self.compact()
+
+    def _replay(self, path):
+        if not os.path.exists(path): return
+        with open(path, "r", encoding="utf-8") as f:
+            for ln in f:
+                parts = ln.strip().split(",")
+                # Records are idempotent so replaying twice after a crash is safe
+                if parts[0] == "+" and len(parts) == 7:
+                    s = Student(*parts[1:])
+                    old = self.by_code(s.code)
+                    if old: self._replace(old, s)
+                    else: self._add(s)
+                elif parts[0] == "-" and len(parts) == 2 and parts[1].isdigit():
+                    s = self.by_code(int(parts[1]))
+                    if s: self._delete(s)
+
+    def compact(self):
+        """Snapshot the students and fold the journal in, on a worker thread."""
+        with self.lock:
+            if self.compactor and self.compactor.is_alive(): return
+            if not os.path.exists(self.journal_path): return
+            lines = [s.to_line() for s in self.students]
+            old = self.journal_path + ".old"
+            if os.path.exists(old):
+                # Keep records from an earlier, unfinished compaction
+                with open(self.journal_path, "r", encoding="utf-8") as src, \
+                        open(old, "a", encoding="utf-8") as dst:
+                    dst.write(src.read())
+                os.remove(self.journal_path)
+            else:
+                os.replace(self.journal_path, old)
+            self.compactor = threading.Thread(target=self._write_snapshot,
+                                              args=(lines,), name="journal-compactor")
+            self.compactor.start()
+
+    def snapshot(self):
+        """A copy of the students that later edits won't change; call with the lock held."""
+        return list(self.students)
+
+    def _save_behind(self):
+        # Runs on the WriteBehind thread; only the copy is made under the lock
+        with self.lock: students = self.snapshot()
+        self._write_snapshot([s.to_line() for s in students])
+
+    def _write_snapshot(self, lines):
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(str(len(lines)) + "\n")
+            for ln in lines:
+                f.write(ln + "\n")
+            f.flush(); os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+        self.disk = self._fingerprint()
+        old = self.journal_path + ".old"
+        if os.path.exists(old): os.remove(old)
+
+    def _join_compactor(self):
+        if self.compactor: self.compactor.join(); self.compactor = None
+
+# ------------------ Columnar Manager ------------------
+class StudentRow(Student):
+    """A Student view over one row of a ColumnarStore.
+
+    Views are cheap and made on demand; one is only valid until the next
+    add or delete.
+    """
+    __slots__ = ("store", "i")
+
+    def __init__(self, store, i):
+        self.store = store
+        self.i = i
+
+    code = property(lambda self: self.store.codes[self.i])
+    name = property(lambda self: self.store.name(self.i))
+    c1 = property(lambda self: self.store.c1[self.i])
+    c2 = property(lambda self: self.store.c2[self.i])
+    c3 = property(lambda self: self.store.c3[self.i])
+    exam = property(lambda self: self.store.exam[self.i])
+
+    def cw(self): return self.c1 + self.c2 + self.c3
+    def total(self): return self.store.totals[self.i]
+    def pct(self): return pct_of(self.total())
+    def grade(self): return grade_of(self.total())
+
+class ColumnarStudentManager(StudentManager):
+    """StudentManager whose students live in typed arrays (see columnar.py).
+
+    Aggregates and sorting run over whole columns instead of calling
+    total()/pct() per Student.
+    """
+    ranks = None  # TotalCounts over the totals column, built by the first rank query
+    on_total = {}  # total -> first row with it, as found by highest()/lowest() since the last edit
+
+    def _read(self):
+        if self.workers > 1:
+            self.students = ColumnarStore(StudentRow)
+            for shard, _ in iter_shards(self.path, self.workers):
+                self.students.extend_columns(shard)
+            self.reindex()
+            return
+        super()._read()
+
+    def _fill(self, rows):
+        self.students = ColumnarStore(StudentRow)
+        self.students.extend(p for p in rows if len(p) == 6)
+        self.reindex()
+
+    def reindex(self):
+        # The store keeps its own code index; the caches over its rows start again
+        self.orders, self.on_total = {}, {}
+        self.ranks = None
+        self.search = None
+
+    def by_code(self, code):
+        i = self.students.find(code)
+        return self.students[i] if i >= 0 else None
+
+    # Aggregates come from the per-total counts, which edits keep up to date,
+    # so only finding the row on the top (or bottom) total touches the column
+    def highest(self):
+        c = self.counts()
+        return self._first_on(c.kth(c.count)) if c.count else None
+
+    def lowest(self):
+        c = self.counts()
+        return self._first_on(c.kth(1)) if c.count else None
+
+    def _first_on(self, total):
+        i = self.on_total.get(total)
+        if i is None: i = self.on_total[total] = self.students.totals.index(total)
+        return self.students[i]
+
+    def average_pct(self):
+        c = self.counts()
+        if not c.count: return 0.0
+        # Summed in hundredths, as TotalsTracker does, so both backends round alike
+        return round(sum(round(pct_of(t) * 100) * n for t, n in c.items()) / 100 / c.count, 2)
+
+    def counts(self):
+        if self.ranks is None: self.ranks = TotalCounts(Counter(self.students.totals))
+        return self.ranks
+
+    def top(self, k, lowest=False):
+        # Row numbers shift on every edit, so there are no per-total buckets to
+        # walk: the counts give the total at the cut-off, and one pass over the
+        # totals column picks the rows past it plus enough of those on it
+        c, totals = self.counts(), self.students.totals
+        k = min(k, c.count)
+        if k <= 0: return []
+        cut = c.kth(k if lowest else c.count - k + 1)
+        need = k - (c.below(cut) if lowest else c.above(cut))
+        if lowest:
+            rows = [i for i, t in enumerate(totals)
+                    if t < cut or (t == cut and (need := need - 1) >= 0)]
+            rows.sort(key=totals.__getitem__)
+        else:
+            rows = [i for i, t in enumerate(totals)
+                    if t > cut or (t == cut and (need := need - 1) >= 0)]
+            rows.sort(key=lambda i: -totals[i])
+        return [StudentRow(self.students, i) for i in rows]
+
+    def snapshot(self):
+        return self.students.copy()
+
+    def ordered(self, by=None, reverse=False):
+        if by is None: return super().ordered(None, reverse)
+        perm = self.orders.get(by)
+        if perm is None: perm = self.orders[by] = self.students.order(by)
+        return OrderedView(self.students, reverse, perm)
+
+    # Row numbers shift on every edit, so cached orders are simply dropped
+    def _add(self, s):
+        self.students.append(s.code, s.name, s.c1, s.c2, s.c3, s.exam)
+        self.orders, self.on_total = {}, {}
+        if self.search is not None: self.search.add(s.code, s.name)
+        if self.ranks is not None: self.ranks.add(s.total())
+
+    def _replace(self, old, s):
+        old_code, old_name, old_total = old.code, old.name, old.total()  # old is a view of the row
+        self.students.set(old.i, s.code, s.name, s.c1, s.c2, s.c3, s.exam)  # may refuse: first
+        self.orders, self.on_total = {}, {}
+        if self.search is not None:
+            self.search.remove(old_code, old_name); self.search.add(s.code, s.name)
+        if self.ranks is not None:
+            self.ranks.add(old_total, -1); self.ranks.add(s.total())
+
+    def _delete(self, s):
+        if self.search is not None: self.search.remove(s.code, s.name)
+        if self.ranks is not None: self.ranks.add(s.total(), -1)
+        self.students.delete(s.i)
+        self.orders, self.on_total = {}, {}
+
+    def _delete_rows(self, rows):
+        self.students.delete_rows(rows)
+        self.reindex()
+
+# ------------------ Lazy Manager ------------------
+class LazyStudentManager(StudentManager):
+    """StudentManager that memory-maps the marks file (see lazyfile.py).
+
+    Opening costs the same whatever the file size; rows are parsed as they
+    are shown or queried. The first add, delete, sort or whole-class
+    figure (average, highest, lowest) parses the rest of the file and
+    carries on as a normal list-backed manager.
+    """
+    def _read(self):
+        self.close_store()
+        self.students = LazyStore(self.path, Student)
+        self.index, self.dupes = {}, {}
+
+    def close_store(self):
+        if isinstance(self.students, LazyStore): self.students.close()
+
+    def materialize(self):
+        if isinstance(self.students, LazyStore):
+            store = self.students
+            self.students = list(store)
+            store.close()
+            self.reindex()
+
+    def reindex(self):
+        if not isinstance(self.students, LazyStore): super().reindex()
+
+    def by_code(self, code):
+        if isinstance(self.students, LazyStore): return self.students.find(code)
+        return super().by_code(code)
+
+    def highest(self):
+        self.materialize(); return super().highest()
+
+    def lowest(self):
+        self.materialize(); return super().lowest()
+
+    def average_pct(self):
+        self.materialize(); return super().average_pct()
+
+    def counts(self):
+        self.materialize(); return super().counts()
+
+    def top(self, k, lowest=False):
+        self.materialize(); return super().top(k, lowest)
+
+    def ordered(self, by=None, reverse=False):
+        if by is not None: self.materialize()
+        return super().ordered(by, reverse)
+
+    def save(self):
+        self.materialize(); super().save()
+
+    def matching(self, text):
+        self.materialize(); return super().matching(text)
+
+    def _build_search(self):
+        # Indexing every name would parse the whole file; wait for the first search
+        if not isinstance(self.students, LazyStore): super()._build_search()
+
+    def reload(self):
+        if not isinstance(self.students, LazyStore): return super().reload()
+        if file_stamp(self.path) in (None, self.disk.stamp): return None
+        self.disk = self._fingerprint()
+        self.search = None
+        self._read()  # reopening costs nothing, and the old mapping may be stale
+        self.finish_load()
+        return Delta((), True)
+
+    def _fingerprint(self):
+        return fingerprint(self.path, body=False)  # opening must not read the whole file
+
+    def close(self):
+        super().close(); self.close_store()
+
+    def _add(self, s):
+        self.materialize(); super()._add(s)
+
+    def _replace(self, old, s):
+        self.materialize(); super()._replace(self.by_code(old.code), s)
+
+    def _delete(self, s):
+        self.materialize(); super()._delete(self.by_code(s.code))
+
+    def _delete_rows(self, rows):
+        self.materialize(); super()._delete_rows(rows)
+
+# ------------------ SQLite storage ------------------
+# Marks can also live in a SQLite file (.db/.sqlite): one row per student,
+# "pos" keeps file order and an index on code gives O(log n) lookups.
+SQLITE_EXTS = (".db", ".sqlite", ".sqlite3")
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS students (
+    pos INTEGER PRIMARY KEY,
+    code INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    c1 INTEGER NOT NULL, c2 INTEGER NOT NULL, c3 INTEGER NOT NULL,
+    exam INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS students_code ON students (code, pos);
+"""
+
+def is_sqlite(path):
+    return os.path.splitext(path)[1].lower() in SQLITE_EXTS
+
+def open_db(path):
+    con = sqlite3.connect(path, check_same_thread=False)
+    con.executescript(SCHEMA)
+    return con
+
+def import_text(txt_path, db_path):
+    """Replace the contents of db_path with the students in a studentMarks.txt file."""
+    # StudentManager would start an empty file for a missing path, wiping the DB
+    if not os.path.isfile(txt_path):
+        raise FileNotFoundError(f"No such marks file: {txt_path}")
+    rows = [(s.code, s.name, s.c1, s.c2, s.c3, s.exam) for s in StudentManager(txt_path).students]
+    con = open_db(db_path)
+    with con:
+        con.execute("DELETE FROM students")
+        con.executemany("INSERT INTO students (code, name, c1, c2, c3, exam) "
+                        "VALUES (?, ?, ?, ?, ?, ?)", rows)
+    con.close()
+    return len(rows)
+
+def export_text(db_path, txt_path):
+    """Write the students in db_path out as a studentMarks.txt file."""
+    con = open_db(db_path)
+    count = con.execute("SELECT COUNT(*) FROM students").fetchone()[0]
+    with open(txt_path, "w", encoding="utf-8") as f:
+        f.write(f"{count}\n")
+        for row in con.execute("SELECT code, name, c1, c2, c3, exam FROM students ORDER BY pos"):
+            f.write(",".join(map(str, row)) + "\n")
+    con.close()
+    return count
+
+class SqliteStudentManager(StudentManager):
+    """StudentManager backed by a SQLite file.
+
+    Students are still held in memory for the views, but add and delete
+    write a single row instead of the whole file. Journal mode and
+    save_delay are not needed and are ignored.
+    """
+    def __init__(self, path, journal=False, journal_limit=JOURNAL_LIMIT, autoload=True,
+                 workers=1, save_delay=None):
+        self.con = open_db(path)
+        super().__init__(path, journal=False, autoload=autoload)
+
+    def _read(self):
+        rows = self.con.execute("SELECT code, name, c1, c2, c3, exam FROM students ORDER BY pos")
+        self.students = [Student(*r) for r in rows]
+        self.reindex()
+
+    def read_batches(self, size=BATCH_SIZE):
+        con = sqlite3.connect(self.path)  # the worker thread gets its own connection
+        try:
+            n = con.execute("SELECT COUNT(*) FROM students").fetchone()[0] or 1
+            cur = con.execute("SELECT code, name, c1, c2, c3, exam FROM students ORDER BY pos")
+            done = 0
+            while True:
+                rows = cur.fetchmany(size)
+                if not rows: break
+                done += len(rows)
+                yield [Student(*r) for r in rows], done / n
+        finally:
+            con.close()
+
+    def save(self):
+        with self.lock, self.con:
+            self.con.execute("DELETE FROM students")
+            self.con.executemany("INSERT INTO students (code, name, c1, c2, c3, exam) "
+                                 "VALUES (?, ?, ?, ?, ?, ?)",
+                                 ((s.code, s.name, s.c1, s.c2, s.c3, s.exam) for s in self.students))
+        self.disk = self._fingerprint()
+
+    # Edits go to the database first, so a failed write leaves memory as it was
+    def add(self, s):
+        self._persist("+", s)
+        with self.lock: self._add(s)
+
+    def add_many(self, students):
+        students = list(students)
+        with self.lock, self.con:  # one transaction
+            self.con.executemany("INSERT INTO students (code, name, c1, c2, c3, exam) "
+                                 "VALUES (?, ?, ?, ?, ?, ?)",
+                                 ((s.code, s.name, s.c1, s.c2, s.c3, s.exam) for s in students))
+            for s in students: self._add(s)
+        self.disk = self._fingerprint()
+
+    def delete(self, s):
+        code = s.code
+        self._persist("-", code)
+        with self.lock: self._delete(s)
+
+    def _persist(self, op, value):
+        with self.lock, self.con:
+            if op == "+":
+                self.con.execute("INSERT INTO students (code, name, c1, c2, c3, exam) "
+                                 "VALUES (?, ?, ?, ?, ?, ?)",
+                                 (value.code, value.name, value.c1, value.c2, value.c3, value.exam))
+            else:
+                # Same as the in-memory delete: the first student with that code
+                self.con.execute("DELETE FROM students WHERE pos = (SELECT MIN(pos) "
+                                 "FROM students WHERE code = ?)", (value,))
+        self.disk = self._fingerprint()
+
+    def _target(self):
+        rows = self.con.execute("SELECT code, name, c1, c2, c3, exam FROM students ORDER BY pos")
+        return [",".join(map(str, r)) for r in rows]
+
+    def _fingerprint(self):
+        return fingerprint(self.path, body=False)
+
+    def close(self):
+        self.con.close()
+
+def open_manager(path, backend="list", **kw):
+    """Pick the manager for a marks file: SQLite by extension, else by backend."""
+    if is_sqlite(path): return SqliteStudentManager(path, **kw)
+    cls = {"list": StudentManager, "columnar": ColumnarStudentManager,
+           "lazy": LazyStudentManager}[backend]
+    return cls(path, **kw)
 
 # ------------------ Add Student Popup ------------------
 class AddStudentPopup(tk.Toplevel):
-    def __init__(self, parent, on_submit):
+    def __init__(self, parent, on_submit, on_import=None):
         super().__init__(parent)
         self.title("Add Student")
-        self.geometry("300x350")
+        self.geometry("300x390")
         self.on_submit = on_submit
+        self.on_import = on_import
 
         self.entries = {}
         fields = ["Code", "Name", "CW1", "CW2", "CW3", "Exam"]
@@ -73,6 +874,12 @@ class AddStudentPopup(tk.Toplevel):
 
         tk.Button(self, text="Submit", bg="#4c57ff", fg="white",
                   command=self.submit).pack(pady=10)
+        if on_import:
+            tk.Button(self, text="Import from file...", command=self.import_file).pack()
+
+    def import_file(self):
+        self.destroy()
+        self.on_import()
 
     def submit(self):
         try:
@@ -93,13 +900,21 @@ class App:
         self.root = root
         self.m = manager
         self.sort_asc = True  # Track sort order
+        self.page = 0          # current "View All" page
+        self.report_avg = 0.0  # average shown in the "View All" footer
+        self.stream = None     # pending after_idle id while a page renders
+        self.paging = False    # the output holds a "View All" page
+        self.loading = False   # True while BackgroundLoader is filling the manager
+        self.filter = None     # students matching the search box, None when it is empty
+        self.filter_job = None  # pending after() id while typing
 
         root.title("Student Manager - Simple Edition")
-        root.geometry("850x500")
+        root.geometry("1150x500")
         root.config(bg="#f2f2f2")
 
-        tk.Label(root, text="Student Manager", bg="#4c57ff", fg="white",
-                 font=("Segoe UI", 18, "bold"), pady=10).pack(fill="x")
+        self.header = tk.Label(root, text="Student Manager", bg="#4c57ff", fg="white",
+                               font=("Segoe UI", 18, "bold"), pady=10)
+        self.header.pack(fill="x")
 
         # Main container
         main = tk.Frame(root, bg="#f2f2f2")
@@ -109,14 +924,34 @@ class App:
         left = tk.Frame(main, bg="#f2f2f2")
         left.pack(side="left", fill="y")
         tk.Label(left, text="Students", font=("Segoe UI", 12, "bold"), bg="#f2f2f2").pack(anchor="w")
-        self.listbox = tk.Listbox(left, width=32, height=23, font=("Segoe UI", 10))
+        # Search box: filters by part of a name or the start of a code as you type
+        self.query = tk.StringVar()
+        search = tk.Entry(left, textvariable=self.query, font=("Segoe UI", 10))
+        search.pack(fill="x", pady=(0, 4))
+        search.bind("<Escape>", lambda e: self.query.set(""))
+        self.query.trace_add("write", lambda *a: self._queue_filter())
+        self.listbox = VirtualList(left, self.shown,
+                                   lambda s: f"{s.code} - {s.name}",
+                                   command=self.select_student,
+                                   width=32, height=22, font=("Segoe UI", 10))
         self.listbox.pack()
-        self.listbox.bind("<<ListboxSelect>>", self.select_student)
 
         # RIGHT: OUTPUT
         right = tk.Frame(main, bg="#f2f2f2")
         right.pack(side="right", fill="both", expand=True)
         tk.Label(right, text="Output", font=("Segoe UI", 12, "bold"), bg="#f2f2f2").pack(anchor="w")
+        # Page controls for "View All"
+        nav = tk.Frame(right, bg="#f2f2f2")
+        nav.pack(side="bottom", fill="x", pady=(4, 0))
+        self.prev_btn = tk.Button(nav, text="< Prev", width=8, state="disabled",
+                                  command=lambda: self.show_page(self.page - 1))
+        self.prev_btn.pack(side="left")
+        self.next_btn = tk.Button(nav, text="Next >", width=8, state="disabled",
+                                  command=lambda: self.show_page(self.page + 1))
+        self.next_btn.pack(side="right")
+        self.page_label = tk.Label(nav, text="", bg="#f2f2f2", font=("Segoe UI", 9))
+        self.page_label.pack()
+        self.progress = ttk.Progressbar(nav, length=160, maximum=1.0)  # shown while loading
         self.output = tk.Text(right, wrap="word", height=20, font=("Segoe UI", 10))
         self.output.pack(fill="both", expand=True)
 
@@ -124,27 +959,121 @@ class App:
         menu = tk.Frame(root, bg="#f2f2f2")
         menu.pack(fill="x", pady=6)
         sbtn = dict(bg="#4c57ff", fg="white", font=("Segoe UI", 10, "bold"), width=16)
-        tk.Button(menu, text="View All", command=self.view_all, **sbtn).pack(side="left", padx=4)
-        tk.Button(menu, text="View Individual", command=self.view_single, **sbtn).pack(side="left", padx=4)
-        tk.Button(menu, text="Highest Score", command=self.view_highest, **sbtn).pack(side="left", padx=4)
-        tk.Button(menu, text="Lowest Score", command=self.view_lowest, **sbtn).pack(side="left", padx=4)
-        tk.Button(menu, text="Sort by Total", command=self.sort_total, **sbtn).pack(side="left", padx=4)
-        tk.Button(menu, text="Add Student", command=self.add_student, **sbtn).pack(side="left", padx=4)
-        tk.Button(menu, text="Delete Student", command=self.delete_student, **sbtn).pack(side="left", padx=4)
+        # These need every student, so they stay disabled while loading
+        self.data_buttons = []
+        for text, cmd in (("View All", self.view_all), ("View Individual", self.view_single),
+                          ("Highest Score", self.view_highest), ("Lowest Score", self.view_lowest),
+                          ("Top / Bottom", self.view_top), ("Student Rank", self.view_rank),
+                          ("Sort by Total", self.sort_total), ("Add Student", self.add_student),
+                          ("Delete Student", self.delete_student)):
+            b = tk.Button(menu, text=text, command=cmd, **sbtn)
+            b.pack(side="left", padx=4)
+            self.data_buttons.append(b)
+        # "Saving..." / "All changes saved", when edits are saved in the background
+        self.save_label = tk.Label(menu, text="", bg="#f2f2f2", font=("Segoe UI", 9))
+        self.save_label.pack(side="right", padx=8)
+        if self.m.saver: self.show_save_state()
 
         self.refresh()
 
+    def add_timings_menu(self, recorder):
+        """Hidden menu for --instrument: right-click the title bar, or Ctrl+Shift+T."""
+        popup = tk.Menu(self.root, tearoff=0)
+        popup.add_command(label="Show timings", command=lambda: self.write(recorder.summary()))
+        popup.add_command(label="Reset timings", command=recorder.reset)
+        self.header.bind("<Button-3>", lambda e: popup.tk_popup(e.x_root, e.y_root))
+        self.root.bind("<Control-T>", lambda e: self.write(recorder.summary()))
+
     # ---------------- Utils ----------------
     def write(self, txt):
+        self._stop_stream()
+        self.set_pager(False)
         self.output.config(state="normal")
         self.output.delete("1.0", "end")
         self.output.insert("end", txt)
         self.output.config(state="disabled")
 
-    def refresh(self):
-        self.listbox.delete(0, "end")
-        for s in self.m.students:
-            self.listbox.insert("end", f"{s.code} - {s.name}")
+    def append(self, txt):
+        self.output.config(state="normal")
+        self.output.insert("end", txt)
+        self.output.config(state="disabled")
+
+    def set_pager(self, on, pages=1):
+        self.paging = on
+        self.prev_btn.config(state="normal" if on and self.page > 0 else "disabled")
+        self.next_btn.config(state="normal" if on and self.page < pages - 1 else "disabled")
+        self.page_label.config(text=f"Page {self.page + 1} / {pages}" if on else "")
+
+    def _stop_stream(self):
+        if self.stream: self.root.after_cancel(self.stream); self.stream = None
+
+    def _stream(self, blocks, footer):
+        # Append CHUNK students now and queue the rest for when Tk is idle
+        chunk = "".join(islice(blocks, CHUNK))
+        if chunk:
+            self.append(chunk)
+            self.stream = self.root.after_idle(self._stream, blocks, footer)
+        else:
+            self.append(footer)
+            self.stream = None
+
+    def shown(self):
+        """The students in the list: search matches, or everyone in display order."""
+        return self.filter if self.filter is not None else self.m.display
+
+    def _queue_filter(self):
+        if self.filter_job: self.root.after_cancel(self.filter_job)
+        self.filter_job = self.root.after(SEARCH_DELAY, self.apply_filter)
+
+    def apply_filter(self):
+        self.filter_job = None
+        text = self.query.get()
+        self.filter = self.m.matching(text) if text.strip() else None
+        self.listbox.top, self.listbox.sel = 0, None
+        self.listbox.refresh()
+
+    def refresh(self, rows=None):
+        """Redraw the list, or only the given rows if nothing was added or removed."""
+        if self.filter is not None:
+            # Edits can change who matches, so search again
+            self.filter = self.m.matching(self.query.get()); rows = None
+        if rows is None: self.listbox.refresh()
+        else: self.listbox.update_rows(rows)
+        if self.stream and self.paging:
+            # A "View All" page is still rendering; restart it on the new data
+            self.report_avg = self.m.average_pct()
+            self.show_page(self.page)
+        elif self.stream:
+            # A Top / Bottom list is still rendering; its rows may be out of date now
+            self._stop_stream()
+            self.append("\n(The class changed while this list was shown; run it again.)\n")
+
+    def show_save_state(self):
+        saver = self.m.saver
+        text = {SAVED: "All changes saved", PENDING: "Unsaved changes",
+                SAVING: "Saving...", ERROR: "Save failed"}[saver.state]
+        self.save_label.config(text=text, fg="#c00000" if saver.state == ERROR else "#555555")
+        self.root.after(SAVE_POLL, self.show_save_state)
+
+    def set_loading(self, frac):
+        """Show load progress (0-1) with the data buttons locked; None when done."""
+        self.loading = loading = frac is not None
+        for b in self.data_buttons:
+            b.config(state="disabled" if loading else "normal")
+        if loading:
+            self.progress["value"] = frac
+            if not self.progress.winfo_manager(): self.progress.pack(side="left", padx=8)
+            self.page_label.config(text=f"Loading students... {len(self.m.students):,} ({frac:.0%})")
+        else:
+            self.progress.pack_forget()
+            self.page_label.config(text="")
+        self.refresh()
+
+    def show_delta(self, delta):
+        """Show a Delta from StudentManager.reload()."""
+        # Positions are in file order, so a sorted view is redrawn instead
+        in_file_order = self.m.order == (None, False) and self.filter is None
+        self.refresh(delta.rows if in_file_order and not delta.resized else None)
 
     def format_s(self, s):
         return (f"Name: {s.name}\n"
@@ -157,19 +1086,30 @@ class App:
 
     # ---------------- Features ----------------
     def select_student(self, e=None):
-        try: idx = self.listbox.curselection()[0]
-        except: return
-        s = self.m.students[idx]
+        idx = self.listbox.selected()
+        if idx is None: return
+        s = self.shown()[idx]
         self.write(self.format_s(s))
 
     def view_all(self):
-        if not self.m.students: self.write("No students available."); return
-        out = ""; total = 0
-        for s in self.m.students:
-            out += self.format_s(s) + "-"*40 + "\n"; total += s.pct()
-        avg = round(total / len(self.m.students), 2)
-        out += f"\nTotal Students: {len(self.m.students)}\nAverage Percentage: {avg}%"
-        self.write(out)
+        if not self.m.students:
+            self.write("No students available.")
+            return
+        self.report_avg = self.m.average_pct()
+        self.show_page(0)
+
+    def show_page(self, page):
+        students = self.m.display
+        n = len(students)
+        pages = max(1, -(-n // PAGE_SIZE))
+        self.page = max(0, min(page, pages - 1))
+        start = self.page * PAGE_SIZE
+        blocks = (self.format_s(students[i]) + "-"*40 + "\n"
+                  for i in range(start, min(n, start + PAGE_SIZE)))
+        footer = f"\nTotal Students: {n}\nAverage Percentage: {self.report_avg}%"
+        self.write("")
+        self.set_pager(True, pages)
+        self._stream(blocks, footer)
 
     def view_single(self):
         from tkinter import simpledialog
@@ -181,53 +1121,193 @@ class App:
 
     def view_highest(self):
         if not self.m.students: return
-        s = max(self.m.students, key=lambda x: x.total())
+        s = self.m.highest()
         self.write("Highest Scoring Student:\n\n" + self.format_s(s))
 
     def view_lowest(self):
         if not self.m.students: return
-        s = min(self.m.students, key=lambda x: x.total())
+        s = self.m.lowest()
         self.write("Lowest Scoring Student:\n\n" + self.format_s(s))
 
+    # ---------------- Ranks ----------------
+    def view_top(self):
+        """List the top or bottom N students, or N percent ("10", "-5", "5%", "-5%")."""
+        from tkinter import simpledialog
+        text = simpledialog.askstring(
+            "Top / Bottom", "How many students? e.g. 10 or 5%\n(start with - for the bottom)",
+            initialvalue=TOP_DEFAULT)
+        if not text: return
+        text = text.strip()
+        lowest = text.startswith("-")
+        amount = text.lstrip("-").rstrip("%").strip()
+        try: n = float(amount) if text.endswith("%") else int(amount)
+        except ValueError: messagebox.showerror("Error", f"{text!r} is not a number."); return
+        if n <= 0: return
+        students = (self.m.top_percent(n, lowest) if text.endswith("%")
+                    else self.m.top(n, lowest))
+        what = f"{n:g}%" if text.endswith("%") else str(n)
+        rows = (f"{self.m.rank(s):>6}. {s.code} - {s.name}  {s.total()}/160 ({s.pct()}%)\n"
+                for s in students)
+        self.write(f"{'Bottom' if lowest else 'Top'} {what} by total "
+                   f"({len(students):,} student(s)):\n\n")
+        self._stream(rows, "")
+
+    def view_rank(self):
+        from tkinter import simpledialog
+        code = simpledialog.askinteger("Rank", "Enter student code:")
+        if code is None: return
+        s = self.m.by_code(code)
+        if not s: messagebox.showinfo("Not found", "No student with that code."); return
+        n = self.m.counts().count
+        self.write(f"Rank {self.m.rank(s):,} of {n:,} "
+                   f"(scored higher than {self.m.percentile(s)}% of the class)\n\n"
+                   + self.format_s(s))
+
     # ---------------- Sort / Add / Delete ----------------
     def sort_total(self):
-        self.m.students.sort(key=lambda s: s.total(), reverse=not self.sort_asc)
+        self.m.set_order("total", reverse=not self.sort_asc)
         self.sort_asc = not self.sort_asc
-        self.m.save()
         self.refresh()
         order = "ascending" if self.sort_asc else "descending"
         self.write(f"Students sorted by total score ({order}).")
 
     def add_student(self):
-        AddStudentPopup(self.root, self._add_student_submit)
+        AddStudentPopup(self.root, self._add_student_submit, self.import_students)
 
     def _add_student_submit(self, code, name, c1, c2, c3, exam):
         if self.m.by_code(code):
             messagebox.showerror("Error", "Code already exists."); return
+        if "," in name:  # the marks file is comma separated
+            messagebox.showerror("Error", "Name cannot contain a comma."); return
         s = Student(code, name, c1, c2, c3, exam)
-        self.m.students.append(s)
-        self.m.save()
+        self.m.add(s)
         self.refresh()
         messagebox.showinfo("Added", "Student added successfully.")
 
+    def import_students(self):
+        """Add every valid row of a CSV or marks file: one save, one refresh."""
+        path = filedialog.askopenfilename(
+            title="Import Students",
+            filetypes=[("CSV or marks files", "*.csv *.txt"), ("All files", "*.*")])
+        if not path: return
+        try: rows, problems = read_rows(path, self.m.by_code)
+        except (OSError, UnicodeDecodeError) as e:
+            messagebox.showerror("Error", f"Could not read {path}:\n{e}"); return
+        if rows:
+            self.m.add_many(Student(*r) for r in rows)
+            self.refresh()
+        # The output panel gets every rejected row; the dialog only the first few
+        report = [f"Imported {len(rows)} student(s) from {os.path.basename(path)}."]
+        if problems:
+            report.append(f"Skipped {len(problems)} row(s):")
+            report += [f"  Line {n}: {why}" for n, why in problems]
+        self.write("\n".join(report) + "\n")
+        summary = report[:2 + IMPORT_SHOWN]
+        if len(problems) > IMPORT_SHOWN:
+            summary.append(f"  ...and {len(problems) - IMPORT_SHOWN} more (see Output)")
+        (messagebox.showwarning if problems else messagebox.showinfo)("Import", "\n".join(summary))
+
     def delete_student(self):
         from tkinter import simpledialog
         code = simpledialog.askinteger("Delete", "Student code:")
         if code is None: return
         s = self.m.by_code(code)
         if not s: messagebox.showerror("Error", "Student not found."); return
-        self.m.students.remove(s)
-        self.m.save()
+        self.m.delete(s)
         self.refresh()
         messagebox.showinfo("Deleted", "Student removed.")
 
+# ------------------ Disk Watcher ------------------
+class DiskWatcher:
+    """Polls the marks file and applies changes other programs make to it."""
+    def __init__(self, app, poll=WATCH_POLL):
+        self.app = app
+        self.poll = poll
+        self.w = FileWatcher(app.m.path)
+        app.root.after(poll, self._tick)
+
+    def _tick(self):
+        # While loading, the change stays pending and is picked up afterwards
+        if not self.app.loading and self.w.poll():
+            delta = self.app.m.reload()
+            if delta: self.app.show_delta(delta)
+        self.app.root.after(self.poll, self._tick)
+
+    def close(self):
+        self.w.close()
+
 # ---------------- MAIN ----------------
-def main():
-    base = os.path.dirname(os.path.abspath(__file__))
-    path = os.path.join(base, "studentMarks.txt")
-    mgr = StudentManager(path)
+# What --instrument times (see instrument.py)
+MANAGER_TIMED = ("load", "finish_load", "save", "_write_snapshot", "by_code", "reload",
+                 "matching", "top", "counts")
+APP_TIMED = ("refresh", "write", "append", "view_all", "show_page", "select_student",
+             "view_highest", "view_lowest", "view_top", "view_rank", "sort_total",
+             "apply_filter", "import_students", "show_delta")
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Student Manager")
+    ap.add_argument("path", nargs="?",
+                    default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "studentMarks.txt"),
+                    help="marks file: studentMarks.txt format, or SQLite (.db/.sqlite)")
+    ap.add_argument("--backend", choices=("list", "columnar", "lazy"), default="list",
+                    help="columnar keeps marks in typed arrays; lazy memory-maps the "
+                         "file and parses rows on demand (for very large files)")
+    ap.add_argument("--workers", type=int, default=1,
+                    help="parse the marks file with this many processes")
+    ap.add_argument("--import-text", metavar="TXT",
+                    help="load a studentMarks.txt file into the SQLite file PATH first")
+    ap.add_argument("--export-text", metavar="TXT",
+                    help="write the SQLite file PATH out as studentMarks.txt and exit")
+    ap.add_argument("--journal", action="store_true",
+                    help="log each edit to PATH.journal instead of saving the whole "
+                         "file in the background")
+    ap.add_argument("--no-watch", action="store_true",
+                    help="don't pick up changes other programs make to the marks file")
+    ap.add_argument("--instrument", nargs="?", const="time", metavar="MODES",
+                    help="time loading, saving, lookups and the UI handlers, printing a "
+                         "summary on exit; MODES adds cprofile and/or tracemalloc "
+                         f"(also set by ${ENV})")
+    args = ap.parse_args(argv)
+    try: recorder = Recorder.from_env(args.instrument)
+    except ValueError as e: ap.error(str(e))
+
+    if (args.import_text or args.export_text) and not is_sqlite(args.path):
+        ap.error("--import-text/--export-text need a .db or .sqlite PATH")
+    if args.import_text:
+        try: n = import_text(args.import_text, args.path)
+        except FileNotFoundError as e: ap.error(str(e))
+        print(f"Imported {n} students into {args.path}")
+    if args.export_text:
+        print(f"Exported {export_text(args.path, args.export_text)} students to {args.export_text}")
+        return
+
+    if recorder:
+        for cls in (StudentManager, ColumnarStudentManager, LazyStudentManager, SqliteStudentManager):
+            recorder.patch(cls, MANAGER_TIMED)
+        recorder.patch(App, APP_TIMED)
+        recorder.patch(BackgroundLoader, ("_work",))  # parsing on the worker thread
+        atexit.register(lambda: print(recorder.summary(), file=sys.stderr))
+
+    # The lazy backend opens instantly; the others load behind the window
+    background = args.backend != "lazy" or is_sqlite(args.path)
+    mgr = open_manager(args.path, args.backend, journal=args.journal, autoload=not background,
+                       workers=args.workers, save_delay=SAVE_DELAY)
     root = tk.Tk()
-    App(root, mgr)
+    app = App(root, mgr)
+    if recorder: app.add_timings_menu(recorder)
+    if background: BackgroundLoader(app)
+    watcher = None if args.no_watch else DiskWatcher(app)
+
+    def on_close():
+        # Wait for the last edits to reach the disk before the window goes
+        err = mgr.saver.flush() if mgr.saver else None
+        if err and not messagebox.askyesno(
+                "Save failed", f"Could not save {mgr.path}:\n{err}\n\nQuit anyway?"):
+            return
+        if watcher: watcher.close()
+        mgr.close()
+        root.destroy()
+    root.protocol("WM_DELETE_WINDOW", on_close)
     root.mainloop()
 
 if __name__ == "__main__":
@@ -0,0 +1,154 @@
+"""Running aggregates over a changing set of students.
+
+StudentManager updates a TotalsTracker on every add and delete, so the
+average, highest and lowest figures never need a pass over the class.
+TotalCounts answers rank questions ("how many scored more than 120?",
+"what total is the 50th from the top?") from the number of students on
+each total.
+"""
+from heapq import heappop, heappush, nlargest, nsmallest
+
+
+class TotalsTracker:
+    """Count, percentage sum and highest/lowest student by total.
+
+    Students are bucketed by total, and two heaps hold the totals that
+    have a bucket. Emptied buckets leave stale heap entries, which are
+    dropped the next time they reach the top. Adding or removing a student
+    costs O(log n) at worst. With equal totals, the student added first is
+    returned.
+    """
+    def __init__(self, students=()):
+        self.count = 0
+        self.pct_cents = 0  # sum of percentages in hundredths, kept exact
+        self.buckets = {}   # total -> {id(student): student}, insertion ordered
+        self.hi = []        # negated totals
+        self.lo = []
+        self.ranks = None   # TotalCounts, built by the first rank query
+        for s in students:
+            self.add(s)
+
+    def add(self, s):
+        t = s.total()
+        bucket = self.buckets.get(t)
+        if bucket is None:
+            bucket = self.buckets[t] = {}
+            heappush(self.hi, -t); heappush(self.lo, t)
+        bucket[id(s)] = s
+        self.count += 1
+        self.pct_cents += round(s.pct() * 100)
+        if self.ranks is not None: self.ranks.add(t)
+
+    def remove(self, s):
+        t = s.total()
+        bucket = self.buckets[t]
+        del bucket[id(s)]
+        if not bucket: del self.buckets[t]
+        self.count -= 1
+        self.pct_cents -= round(s.pct() * 100)
+        if self.ranks is not None: self.ranks.add(t, -1)
+
+    def average_pct(self):
+        return round(self.pct_cents / 100 / self.count, 2) if self.count else 0.0
+
+    def highest(self):
+        while self.hi and -self.hi[0] not in self.buckets: heappop(self.hi)
+        return next(iter(self.buckets[-self.hi[0]].values())) if self.hi else None
+
+    def lowest(self):
+        while self.lo and self.lo[0] not in self.buckets: heappop(self.lo)
+        return next(iter(self.buckets[self.lo[0]].values())) if self.lo else None
+
+    def counts(self):
+        """TotalCounts for the tracked students, kept up to date from now on."""
+        if self.ranks is None:
+            self.ranks = TotalCounts({t: len(b) for t, b in self.buckets.items()})
+        return self.ranks
+
+    def top(self, k, lowest=False):
+        """The k students with the highest (or lowest) totals, best first.
+
+        Only the distinct totals are ordered, and there are at most a few
+        hundred of those, so this costs about O(k). Equal totals come in
+        the order added.
+        """
+        pick = nsmallest if lowest else nlargest
+        out = []
+        for t in pick(len(self.buckets), self.buckets):
+            for s in self.buckets[t].values():
+                if len(out) >= k: return out
+                out.append(s)
+        return out
+
+
+class TotalCounts:
+    """How many students are on each total, in a Fenwick tree.
+
+    Counting the students above or below a total, and finding the total
+    at a given position, cost O(log T) for T possible totals. The tree
+    covers 0..160 to start with and grows if a total falls outside it.
+    """
+    def __init__(self, counts=None, lo=0, hi=160):
+        self.lo, self.size = lo, hi - lo + 1
+        self.count = 0
+        self.tree = [0] * (self.size + 1)  # 1-based
+        if counts:
+            lo, hi = min(lo, min(counts)), max(hi, max(counts))
+            self.lo, self.size = lo, hi - lo + 1
+            tree = [0] * (self.size + 1)
+            for t, n in counts.items():
+                tree[t - lo + 1] += n
+            for i in range(1, self.size + 1):  # linear-time build
+                j = i + (i & -i)
+                if j <= self.size: tree[j] += tree[i]
+            self.tree = tree
+            self.count = sum(counts.values())
+
+    def add(self, total, n=1):
+        if not self.lo <= total < self.lo + self.size: self._grow(total)
+        tree, i = self.tree, total - self.lo + 1
+        while i <= self.size:
+            tree[i] += n
+            i += i & -i
+        self.count += n
+
+    def at_most(self, total):
+        """Students whose total is total or less."""
+        tree, i = self.tree, min(total - self.lo + 1, self.size)
+        n = 0
+        while i > 0:
+            n += tree[i]
+            i -= i & -i
+        return n
+
+    def items(self):
+        """(total, students on it) for every total someone has, lowest first."""
+        prev = 0
+        for t in range(self.lo, self.lo + self.size):
+            n = self.at_most(t)
+            if n > prev: yield t, n - prev
+            prev = n
+
+    def above(self, total):
+        return self.count - self.at_most(total)
+
+    def below(self, total):
+        return self.at_most(total - 1)
+
+    def kth(self, k):
+        """Total of the k-th lowest student (k from 1), or None if there are fewer."""
+        if not 1 <= k <= self.count: return None
+        tree, pos, step = self.tree, 0, 1 << self.size.bit_length()
+        while step:
+            nxt = pos + step
+            if nxt <= self.size and tree[nxt] < k:
+                pos = nxt
+                k -= tree[nxt]
+            step >>= 1
+        return pos + self.lo
+
+    def _grow(self, total):
+        counts = dict(self.items())
+        counts[total] = 0
+        lo = min(self.lo, total)
+        self.__init__(counts, lo, max(self.lo + self.size - 1, total))
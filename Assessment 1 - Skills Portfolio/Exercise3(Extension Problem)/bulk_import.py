@@ -0,0 +1,62 @@
+"""Reading and checking a batch of new students from a CSV or marks file.
+
+Rows are code,name,cw1,cw2,cw3,exam. A studentMarks.txt count line or a
+CSV heading row at the top is skipped. Every row is checked in a single
+pass, and each rejected row is reported with its line number and the
+reason.
+"""
+import csv
+
+LIMITS = (("CW1", 20), ("CW2", 20), ("CW3", 20), ("Exam", 100))
+
+
+def _is_heading(row):
+    # "120" (marks file count) or "code,name,..." (CSV heading). A heading has
+    # no numbers in it at all, so a first data row with a bad code is still
+    # checked (and reported) rather than skipped.
+    fields = [f.strip() for f in row]
+    if len(fields) == 1 and fields[0].isdigit(): return True
+    return not any(f.lstrip("-").isdigit() for f in fields)
+
+
+def check_row(row, exists, seen):
+    """(code, name, c1, c2, c3, exam), or a string saying what is wrong with the row."""
+    if len(row) != 6:
+        return f"expected 6 fields, found {len(row)}"
+    code, name, *marks = (f.strip() for f in row)
+    try: code = int(code)
+    except ValueError: return f"code {code!r} is not a number"
+    if not name: return "name is empty"
+    if "," in name: return "name contains a comma"  # the marks file is comma separated
+    out = []
+    for (label, top), v in zip(LIMITS, marks):
+        try: v = int(v)
+        except ValueError: return f"{label} {v!r} is not a number"
+        if not 0 <= v <= top: return f"{label} {v} is not between 0 and {top}"
+        out.append(v)
+    if code in seen: return f"code {code} appears twice in the file (line {seen[code]})"
+    if exists(code): return f"code {code} already exists"
+    return (code, name, *out)
+
+
+def read_rows(path, exists):
+    """Check every row of path; returns (good rows, [(line number, problem)]).
+
+    exists(code) says whether the manager already has a student with that code.
+    """
+    good, problems, seen = [], [], {}  # seen: code -> line it was first on
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        reader = csv.reader(f)
+        first = True
+        for row in reader:
+            if not any(field.strip() for field in row): continue
+            if first:
+                first = False
+                if _is_heading(row): continue
+            r = check_row(row, exists, seen)
+            if isinstance(r, str):
+                problems.append((reader.line_num, r))
+            else:
+                seen[r[0]] = reader.line_num
+                good.append(r)
+    return good, problems
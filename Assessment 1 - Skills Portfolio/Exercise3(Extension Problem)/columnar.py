@@ -0,0 +1,204 @@
+"""Columnar, array-backed storage for student marks.
+
+Each field lives in its own typed array instead of one Python object per
+student, and the total is stored alongside the marks so aggregate views
+never recompute it. Names are packed into one bytearray. Deleted names are
+left behind as garbage until the file is loaded again.
+
+Every row also gets an id, and ids only ever go up along the rows, so a
+row's number is bisect(ids, id) however many rows before it were deleted.
+The code index maps code -> id and is kept up to date by each edit.
+"""
+from array import array
+from bisect import bisect_left
+from itertools import accumulate, compress
+
+MAX_TOTAL = 160
+MAX_ID = 0xFFFFFFFF  # largest row id an "I" array holds
+
+
+def _grade(p):
+    if p >= 70: return "A"
+    if p >= 60: return "B"
+    if p >= 50: return "C"
+    if p >= 40: return "D"
+    return "F"
+
+# Percentage and grade depend only on the total, so look them up by total
+PCT = [round((t / MAX_TOTAL) * 100, 2) for t in range(MAX_TOTAL + 1)]
+GRADE = [_grade(p) for p in PCT]
+
+
+def pct_of(total):
+    return PCT[total] if 0 <= total <= MAX_TOTAL else round((total / MAX_TOTAL) * 100, 2)
+
+
+def grade_of(total):
+    return GRADE[total] if 0 <= total <= MAX_TOTAL else _grade(pct_of(total))
+
+
+class ColumnarStore:
+    """A sequence of student rows held in typed arrays.
+
+    Indexing returns view(store, i), so callers get Student-like objects
+    without the store keeping one object per row.
+    """
+    def __init__(self, view):
+        self.view = view
+        self.codes = array("i")
+        self.c1 = array("h"); self.c2 = array("h"); self.c3 = array("h")
+        self.exam = array("h")
+        self.totals = array("h")
+        self.name_off = array("I"); self.name_len = array("H")
+        self.names = bytearray()
+        self.ids = array("I")  # ascending, see the module docstring
+        self._first = None  # code -> id of the first row with that code, built on demand
+
+    # ---------------- Sequence ----------------
+    def __len__(self): return len(self.codes)
+
+    def __getitem__(self, i):
+        if i < 0: i += len(self.codes)
+        if not 0 <= i < len(self.codes): raise IndexError("student index out of range")
+        return self.view(self, i)
+
+    def __iter__(self):
+        for i in range(len(self.codes)):
+            yield self.view(self, i)
+
+    def index(self, s):
+        return s.i
+
+    # ---------------- Rows ----------------
+    def name(self, i):
+        off = self.name_off[i]
+        return self.names[off:off + self.name_len[i]].decode("utf-8")
+
+    def row(self, i):
+        return (self.codes[i], self.name(i), self.c1[i], self.c2[i], self.c3[i], self.exam[i])
+
+    def extend(self, rows):
+        """Append rows of (code, name, c1, c2, c3, exam); fields may be strings."""
+        for r in rows:
+            self.append(*r)
+
+    def append(self, code, name, c1, c2, c3, exam):
+        """Add a row; a value too big for its column raises OverflowError and adds nothing."""
+        c1, c2, c3, exam, code = int(c1), int(c2), int(c3), int(exam), int(code)
+        raw = name.encode("utf-8")
+        n = len(self.codes)
+        rid = self._new_ids(1)
+        try:
+            self.codes.append(code)
+            self.c1.append(c1); self.c2.append(c2); self.c3.append(c3)
+            self.exam.append(exam)
+            self.totals.append(c1 + c2 + c3 + exam)
+            self.name_off.append(len(self.names)); self.name_len.append(len(raw))
+            self.ids.append(rid)
+        except OverflowError:
+            for col in self._columns(): del col[n:]  # back in step
+            raise
+        self.names += raw
+        if self._first is not None: self._first.setdefault(code, rid)
+
+    def extend_columns(self, shard):
+        """Append a shard from parallel_load.parse_shard without going through Python rows.
+
+        The shard's columns are narrowed to this store's types first, so a
+        value too big for its column raises OverflowError and adds nothing.
+        """
+        codes, c1, c2, c3, exam, totals, name_len = (
+            array(col.typecode, src) for col, src in zip(
+                (self.codes, self.c1, self.c2, self.c3, self.exam, self.totals, self.name_len),
+                shard[:7]))
+        names = shard[7]
+        offs = array("I", accumulate(name_len, initial=len(self.names)))
+        self.codes.extend(codes)
+        self.c1.extend(c1); self.c2.extend(c2); self.c3.extend(c3)
+        self.exam.extend(exam)
+        self.totals.extend(totals)
+        self.name_off.extend(offs[:-1]); self.name_len.extend(name_len)
+        self.names += names
+        start = self._new_ids(len(codes))
+        self.ids.extend(range(start, start + len(codes)))
+        self._first = None
+
+    def _new_ids(self, n):
+        # First of n fresh ids; numbers the rows again from 0 in the unlikely case ids run out
+        start = self.ids[-1] + 1 if self.ids else 0
+        if start + n - 1 > MAX_ID:
+            self.ids = array("I", range(len(self.codes)))
+            self._first = None
+            start = len(self.codes)
+        return start
+
+    def set(self, i, code, name, c1, c2, c3, exam):
+        """Overwrite row i; like append(), an OverflowError leaves the row as it was."""
+        c1, c2, c3, exam, code = int(c1), int(c2), int(c3), int(exam), int(code)
+        raw = name.encode("utf-8")
+        was = [col[i] for col in self._columns()]
+        old = self.codes[i]
+        try:
+            self.codes[i] = code
+            self.c1[i] = c1; self.c2[i] = c2; self.c3[i] = c3
+            self.exam[i] = exam
+            self.totals[i] = c1 + c2 + c3 + exam
+            self.name_off[i] = len(self.names); self.name_len[i] = len(raw)
+        except OverflowError:
+            for col, v in zip(self._columns(), was): col[i] = v
+            raise
+        self.names += raw
+        first, rid = self._first, self.ids[i]
+        if first is not None and old != code:
+            if first.get(old) == rid: self._refind(old)
+            if first.get(code, rid) >= rid: first[code] = rid
+
+    def delete(self, i):
+        code, rid = self.codes[i], self.ids[i]
+        for col in self._columns():
+            del col[i]
+        if self._first is not None and self._first.get(code) == rid: self._refind(code)
+
+    def delete_rows(self, rows):
+        """Delete the rows at these row numbers, in one pass over each column."""
+        keep = bytearray(b"\1") * len(self.codes)
+        for i in rows: keep[i] = 0
+        for col in self._columns():
+            col[:] = array(col.typecode, compress(col, keep))
+        self._first = None
+
+    def copy(self):
+        """An independent store with the same rows (the arrays are copied, not shared)."""
+        other = ColumnarStore(self.view)
+        for mine, theirs in zip(self._columns(), other._columns()):
+            theirs.extend(mine)
+        other.names = bytearray(self.names)
+        return other
+
+    def _columns(self):
+        return (self.codes, self.c1, self.c2, self.c3, self.exam, self.totals,
+                self.name_off, self.name_len, self.ids)
+
+    # ---------------- Lookups ----------------
+    def find(self, code):
+        """Row number of the first student with this code, or -1."""
+        if self._first is None:
+            # Built back to front so the first row with a code wins
+            self._first = dict(zip(reversed(self.codes), reversed(self.ids)))
+        rid = self._first.get(code)
+        return -1 if rid is None else bisect_left(self.ids, rid)
+
+    def _refind(self, code):
+        # The row code pointed at has gone or changed code; use the next one with it, if any
+        try: self._first[code] = self.ids[self.codes.index(code)]
+        except ValueError: del self._first[code]
+
+    def order(self, by):
+        """Row numbers sorted by "total", "code", "exam" or "name" (stable)."""
+        cols = {"total": self.totals, "code": self.codes, "exam": self.exam}
+        key = cols[by].__getitem__ if by in cols else self.name
+        return array("I", sorted(range(len(self.codes)), key=key))
+
+    def nbytes(self):
+        """Approximate memory held by the columns."""
+        return sum(c.itemsize * len(c) for c in self._columns()) + len(self.names)
@@ -0,0 +1,159 @@
+"""Opt-in timing and profiling of named calls.
+
+A Recorder wraps chosen methods of chosen classes so every call is timed
+into a per-name latency histogram. With "cprofile" or "tracemalloc" in its
+modes it also runs cProfile, or measures peak memory, around each call
+made on the main thread. Nested calls (view_all calling write, or a
+subclass's save calling the base save) are all timed. Only the outermost
+call is profiled.
+
+Nothing is wrapped unless a Recorder is made, so the app pays nothing
+when this is off. summary() gives a plain-text table. For Tk, use
+`python Exercise3Extension.py --instrument` or set
+STUDENT_MANAGER_INSTRUMENT=time,cprofile,tracemalloc.
+"""
+import cProfile
+import functools
+import io
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+
+ENV = "STUDENT_MANAGER_INSTRUMENT"
+MODES = ("time", "cprofile", "tracemalloc")
+PROFILE_LINES = 25  # functions listed from the cProfile stats
+
+
+def parse_modes(text):
+    """Modes from a flag or environment value: "1"/"on"/"" mean just "time"."""
+    if text is None: return None
+    text = text.strip().lower()
+    if text in ("0", "off", "no", "false"): return None
+    modes = {m.strip() for m in text.split(",") if m.strip()} - {"1", "on", "yes", "true"}
+    unknown = modes - set(MODES)
+    if unknown: raise ValueError(f"unknown instrument mode(s): {', '.join(sorted(unknown))}")
+    return modes | {"time"}
+
+
+class Histogram:
+    """Latencies in power-of-two microsecond buckets, plus count/total/max."""
+    __slots__ = ("buckets", "count", "total", "max", "peak_mem")
+
+    def __init__(self):
+        self.buckets = [0] * 40  # bucket b holds calls under 2**b microseconds
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.peak_mem = None  # bytes, with tracemalloc, for outermost calls
+
+    def add(self, secs):
+        self.buckets[min(int(secs * 1e6).bit_length(), 39)] += 1
+        self.count += 1
+        self.total += secs
+        if secs > self.max: self.max = secs
+
+    def quantile(self, q):
+        """Upper bound (seconds) of the bucket holding the q-th quantile."""
+        want = q * self.count
+        seen = 0
+        for b, n in enumerate(self.buckets):
+            seen += n
+            if n and seen >= want: return min((1 << b) / 1e6, self.max)
+        return self.max
+
+
+class Recorder:
+    """Times every call to the methods patch() wraps; see the module docstring."""
+    def __init__(self, modes=("time",)):
+        self.modes = set(modes)
+        self.hists = {}  # label -> Histogram
+        self.lock = threading.Lock()
+        self.local = threading.local()  # depth of profiled calls on this thread
+        self.profile = cProfile.Profile() if "cprofile" in self.modes else None
+        if "tracemalloc" in self.modes and not tracemalloc.is_tracing(): tracemalloc.start()
+        self.started = time.perf_counter()
+
+    @classmethod
+    def from_env(cls, flag=None):
+        """A Recorder if the flag value or $STUDENT_MANAGER_INSTRUMENT asks for one, else None."""
+        modes = parse_modes(flag if flag is not None else os.environ.get(ENV))
+        return cls(modes) if modes else None
+
+    def patch(self, cls, names, prefix=None):
+        """Wrap cls.<name> for each name that cls itself defines."""
+        prefix = prefix or cls.__name__
+        for name in names:
+            fn = cls.__dict__.get(name)
+            if fn is not None and not getattr(fn, "_instrumented", False):
+                setattr(cls, name, self.wrap(fn, f"{prefix}.{name.lstrip('_')}"))
+
+    def wrap(self, fn, label):
+        with self.lock: hist = self.hists.setdefault(label, Histogram())
+        perf = time.perf_counter
+        extra = self.profile is not None or "tracemalloc" in self.modes
+
+        @functools.wraps(fn)
+        def timed(*args, **kw):
+            if extra and threading.current_thread() is threading.main_thread():
+                return self._profiled(fn, hist, args, kw)
+            t = perf()
+            try: return fn(*args, **kw)
+            finally:
+                secs = perf() - t
+                with self.lock: hist.add(secs)
+        timed._instrumented = True
+        return timed
+
+    def _profiled(self, fn, hist, args, kw):
+        depth = getattr(self.local, "depth", 0)
+        self.local.depth = depth + 1
+        outer = depth == 0
+        mem = outer and tracemalloc.is_tracing()
+        if mem:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+        if outer and self.profile: self.profile.enable()
+        t = time.perf_counter()
+        try: return fn(*args, **kw)
+        finally:
+            secs = time.perf_counter() - t
+            if outer and self.profile: self.profile.disable()
+            self.local.depth = depth
+            with self.lock:
+                hist.add(secs)
+                if mem: hist.peak_mem = max(hist.peak_mem or 0,
+                                            tracemalloc.get_traced_memory()[1] - base)
+
+    def reset(self):
+        with self.lock:
+            for label in self.hists: self.hists[label] = Histogram()
+        if self.profile: self.profile = cProfile.Profile()
+        self.started = time.perf_counter()
+
+    def summary(self):
+        """A table of every label that was called, slowest total first."""
+        with self.lock: rows = [(k, h) for k, h in self.hists.items() if h.count]
+        rows.sort(key=lambda r: -r[1].total)
+        mem = "tracemalloc" in self.modes
+        out = [f"Timings over {time.perf_counter() - self.started:.1f}s "
+               "(ms; p50/p90/p99 are bucket upper bounds)",
+               f"{'call':28} {'count':>8} {'total':>10} {'mean':>9} {'p50':>8} "
+               f"{'p90':>8} {'p99':>8} {'max':>9}" + ("  peak mem" if mem else "")]
+        ms = lambda secs: secs * 1e3
+        for label, h in rows:
+            line = (f"{label:28} {h.count:>8} {ms(h.total):>10.2f} {ms(h.total / h.count):>9.3f} "
+                    f"{ms(h.quantile(.5)):>8.3f} {ms(h.quantile(.9)):>8.3f} "
+                    f"{ms(h.quantile(.99)):>8.3f} {ms(h.max):>9.3f}")
+            if mem: line += f"  {h.peak_mem / 1024:8.0f}K" if h.peak_mem is not None else "         -"
+            out.append(line)
+        if not rows: out.append("(no instrumented calls yet)")
+        if self.profile:
+            buf = io.StringIO()
+            try:
+                pstats.Stats(self.profile, stream=buf).sort_stats("cumulative").print_stats(PROFILE_LINES)
+                out += ["", "cProfile, by cumulative time:", buf.getvalue().rstrip()]
+            except TypeError:  # nothing was profiled yet
+                pass
+        return "\n".join(out)
@@ -0,0 +1,148 @@
+"""Lazy, memory-mapped access to a studentMarks.txt file.
+
+Opening a LazyStore only maps the file and skips the count header. Row
+offsets are found on demand as far as the furthest row asked for. A row is
+parsed only when it is read, and recently read rows are kept in a bounded
+LRU cache.
+
+Touching a mapped page past the end of a file that has since been cut
+short kills the process with SIGBUS, not an exception. So every access
+first compares the file's size and mtime with the ones it was mapped at,
+and maps it again if another program rewrote it in place.
+"""
+import mmap
+import os
+from array import array
+from collections import OrderedDict
+from itertools import repeat
+
+CACHE_SIZE = 4096  # Parsed rows kept in memory
+COUNT_CHUNK = 1 << 24  # bytes of the map split into lines at a time when counting rows
+
+
+class LazyStore:
+    """Read-only sequence of students backed by an mmap of the marks file.
+
+    make(*fields) turns the six comma-separated fields of a row into a
+    student. The count header is not trusted, since another tool may have
+    added rows without updating it, and blank or malformed lines are not
+    rows. Instead the first len() counts the rows the way the scan will
+    find them, which takes a few C-level passes and parses none of them.
+    """
+    def __init__(self, path, make, cache_size=CACHE_SIZE):
+        self.path = path
+        self.make = make
+        self.cache_size = cache_size
+        self.f = self.mm = None
+        self._open()
+
+    def _open(self):
+        self.close()
+        self.cache = OrderedDict()
+        self.offsets = array("Q")  # start of each data row found so far
+        self.f = open(self.path, "rb")
+        st = os.fstat(self.f.fileno())
+        self.size, self.stamp = st.st_size, (st.st_size, st.st_mtime_ns)
+        self.mm = mmap.mmap(self.f.fileno(), 0, access=mmap.ACCESS_READ) if self.size else None
+        self.pos = self.start = 0
+        self.done = self.mm is None
+        self.rows = None  # number of rows, once len() has counted them
+        if not self.done:
+            self._read_header()
+
+    def _check(self):
+        # Map the file again if it was rewritten in place; see the module docstring
+        st = os.fstat(self.f.fileno())
+        if (st.st_size, st.st_mtime_ns) != self.stamp: self._open()
+
+    def _read_header(self):
+        # The header is the first non-blank line, if it is a bare number
+        pos = 0
+        while pos < self.size:
+            end = self._eol(pos)
+            line = self.mm[pos:end].strip()
+            if line:
+                if line.isdigit(): pos = end + 1
+                break
+            pos = end + 1
+        self.pos = self.start = pos
+
+    def _count_rows(self):
+        # A row is a line with five commas, as in _scan_to; split and count a chunk of lines at once
+        mm, size, n, a = self.mm, self.size, 0, self.start
+        while a < size:
+            b = size if a + COUNT_CHUNK >= size else mm.rfind(b"\n", a, a + COUNT_CHUNK) + 1
+            if b <= a: b = size  # one line longer than a chunk
+            n += list(map(bytes.count, mm[a:b].split(b"\n"), repeat(b","))).count(5)
+            a = b
+        return n
+
+    def _eol(self, pos):
+        end = self.mm.find(b"\n", pos)
+        return self.size if end == -1 else end
+
+    def _scan_to(self, i):
+        """Find row offsets up to and including row i; False if the file ends first."""
+        mm, offsets = self.mm, self.offsets
+        while len(offsets) <= i and not self.done:
+            if self.pos >= self.size:
+                self.done = True; break
+            end = self._eol(self.pos)
+            line = mm[self.pos:end]
+            if line.strip() and line.count(b",") == 5:
+                offsets.append(self.pos)
+            self.pos = end + 1
+        return len(offsets) > i
+
+    def _parse(self, start):
+        return self.make(*self.mm[start:self._eol(start)].decode("utf-8").strip().split(","))
+
+    # ---------------- Sequence ----------------
+    def __len__(self):
+        self._check()
+        if self.done: return len(self.offsets)
+        if self.rows is None: self.rows = self._count_rows()
+        return self.rows
+
+    def __getitem__(self, i):
+        self._check()
+        if i < 0: i += len(self)
+        s = self.cache.get(i)
+        if s is not None:
+            self.cache.move_to_end(i)
+            return s
+        if i < 0 or not self._scan_to(i): raise IndexError("student index out of range")
+        s = self.cache[i] = self._parse(self.offsets[i])
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return s
+
+    def __iter__(self):
+        # Full scans read the file, not the map, so a rewrite part way through
+        # just ends them early; they also leave the cache of visible rows alone
+        self._check()
+        with open(self.path, "rb") as f:
+            f.seek(self.start)
+            for line in f:
+                if line.count(b",") == 5: yield self.make(*line.decode("utf-8").strip().split(","))
+
+    def find(self, code):
+        """Parse and return the first row with this code, or None.
+
+        Searches the mapped bytes directly rather than parsing every row.
+        """
+        self._check()
+        if not self._scan_to(0): return None
+        key = str(code).encode() + b","
+        first = self.offsets[0]
+        at = first if self.mm[first:first + len(key)] == key else self.mm.find(b"\n" + key, first) + 1
+        while at > 0:
+            line = self.mm[at:self._eol(at)]
+            if line.count(b",") == 5:
+                return self.make(*line.decode("utf-8").strip().split(","))
+            at = self.mm.find(b"\n" + key, at) + 1
+        return None
+
+    def close(self):
+        if self.mm is not None: self.mm.close()
+        if self.f is not None: self.f.close()
@@ -0,0 +1,85 @@
+"""Persistent sort orders over the student list.
+
+StudentManager keeps one OrderIndex per sort key that has been asked for
+and updates it on every add and delete, so showing the class by total (or
+name, code, exam) never re-sorts it. Descending order is the same index
+read backwards through an OrderedView.
+"""
+from bisect import bisect_left
+
+ORDER_KEYS = {
+    "total": lambda s: s.total(),
+    "name": lambda s: s.name,
+    "code": lambda s: s.code,
+    "exam": lambda s: s.exam,
+}
+
+
+class OrderIndex:
+    """Students kept sorted by key(s); equal keys stay in the order added."""
+    def __init__(self, key, students=()):
+        self.key = key
+        self.seq = {}   # id(student) -> tie-break number
+        self.next = 0
+        entries = sorted((key(s), self._number(s), s) for s in students)
+        self.keys = [(k, n) for k, n, _ in entries]
+        self.items = [s for _, _, s in entries]
+
+    def _number(self, s):
+        n = self.seq[id(s)] = self.next
+        self.next += 1
+        return n
+
+    def add(self, s):
+        k = (self.key(s), self._number(s))
+        i = bisect_left(self.keys, k)
+        self.keys.insert(i, k)
+        self.items.insert(i, s)
+
+    def remove(self, s):
+        i = bisect_left(self.keys, (self.key(s), self.seq.pop(id(s))))
+        del self.keys[i]
+        del self.items[i]
+
+
+class OrderedView:
+    """Read-only sequence over items, optionally through a permutation and/or reversed."""
+    __slots__ = ("items", "reverse", "perm")
+
+    def __init__(self, items, reverse=False, perm=None):
+        self.items = items
+        self.reverse = reverse
+        self.perm = perm
+
+    def __len__(self):
+        return len(self.perm if self.perm is not None else self.items)
+
+    def __getitem__(self, i):
+        n = len(self)
+        if i < 0: i += n
+        if not 0 <= i < n: raise IndexError("student index out of range")
+        if self.reverse: i = n - 1 - i
+        return self.items[self.perm[i]] if self.perm is not None else self.items[i]
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+
+class KeyedView:
+    """Read-only sequence over keys, each looked up (e.g. by code) when read."""
+    __slots__ = ("keys", "lookup")
+
+    def __init__(self, keys, lookup):
+        self.keys = keys
+        self.lookup = lookup
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __getitem__(self, i):
+        return self.lookup(self.keys[i])
+
+    def __iter__(self):
+        for k in self.keys:
+            yield self.lookup(k)
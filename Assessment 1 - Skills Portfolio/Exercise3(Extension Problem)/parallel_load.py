@@ -0,0 +1,84 @@
+"""Parse a large studentMarks.txt across several processes.
+
+The file is cut into byte ranges that end on a newline. Each range is
+parsed by a ProcessPoolExecutor worker into compact columns (typed arrays
+plus one bytes object of names). That is far cheaper to send back than
+Python objects. Shards come back in file order.
+
+The columns are 64-bit ("q"), so any row the one-process reader accepts
+parses here too; ColumnarStore.extend_columns narrows them to its own
+column types.
+"""
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+
+def shard_bounds(path, shards):
+    """Split the file into at most `shards` (start, end) byte ranges on line boundaries."""
+    size = os.path.getsize(path)
+    cuts = [0]
+    with open(path, "rb") as f:
+        for k in range(1, shards):
+            pos = max(size * k // shards, cuts[-1])
+            f.seek(pos)
+            f.readline()  # move to the start of the next line
+            pos = min(f.tell(), size)
+            if pos > cuts[-1]: cuts.append(pos)
+    if cuts[-1] != size: cuts.append(size)
+    return list(zip(cuts, cuts[1:]))
+
+
+def parse_shard(path, start, end, first):
+    """Parse one byte range into (codes, c1, c2, c3, exam, totals, name_len, names).
+
+    Only the first shard may hold the count header, following the same rule
+    as StudentManager.load: the first non-blank line is skipped if it is a
+    bare number.
+    """
+    codes = array("q"); c1 = array("q"); c2 = array("q"); c3 = array("q")
+    exam = array("q"); totals = array("q"); name_len = array("q")
+    names = bytearray()
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    for raw in data.split(b"\n"):
+        ln = raw.strip()
+        if not ln: continue
+        if first:
+            first = False
+            if ln.isdigit(): continue
+        parts = ln.split(b",")
+        if len(parts) != 6: continue
+        a, b, c, e = int(parts[2]), int(parts[3]), int(parts[4]), int(parts[5])
+        codes.append(int(parts[0]))
+        c1.append(a); c2.append(b); c3.append(c); exam.append(e)
+        totals.append(a + b + c + e)
+        name_len.append(len(parts[1]))
+        names += parts[1]
+    return codes, c1, c2, c3, exam, totals, name_len, bytes(names)
+
+
+def iter_shards(path, workers):
+    """Yield (shard, fraction of the file done) in file order, parsing up to `workers` at once."""
+    bounds = shard_bounds(path, workers * 4)  # a few shards per worker to even out the load
+    if not bounds: return
+    size = bounds[-1][1]
+    if workers <= 1:
+        shards = (parse_shard(path, s, e, i == 0) for i, (s, e) in enumerate(bounds))
+        yield from zip(shards, (e / size for _, e in bounds))
+        return
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        shards = ex.map(parse_shard, [path] * len(bounds), *zip(*bounds),
+                        [i == 0 for i in range(len(bounds))])
+        yield from zip(shards, (e / size for _, e in bounds))
+
+
+def shard_rows(shard):
+    """Turn a parsed shard back into (code, name, c1, c2, c3, exam) tuples."""
+    codes, c1, c2, c3, exam, _, name_len, names = shard
+    off = 0
+    for i in range(len(codes)):
+        n = name_len[i]
+        yield codes[i], names[off:off + n].decode("utf-8"), c1[i], c2[i], c3[i], exam[i]
+        off += n
@@ -0,0 +1,94 @@
+"""Write-behind saving on a background thread.
+
+Edits call mark(). Nothing is written straight away: the thread waits
+until no edit has come for `delay` seconds (or `max_delay` seconds have
+passed since the first unsaved edit), then calls write() once for the
+whole burst. flush() writes whatever is pending and waits for it, for
+quitting.
+"""
+import threading
+import time
+
+SAVED, PENDING, SAVING, ERROR = "saved", "pending", "saving", "error"
+
+
+class WriteBehind:
+    """Coalesces edits into occasional write() calls on a worker thread.
+
+    state is one of SAVED, PENDING, SAVING or ERROR, and error holds the
+    exception from the last failed write. A failed write is tried again
+    after the next delay.
+    """
+    def __init__(self, write, delay=0.5, max_delay=5.0, name="write-behind"):
+        self.write = write
+        self.delay = delay
+        self.max_delay = max_delay
+        self.state = SAVED
+        self.error = None
+        self.cond = threading.Condition()
+        self.first = None   # time of the first unsaved edit, None when clean
+        self.last = None    # time of the latest edit
+        self.urgent = False
+        self.closed = False
+        self.thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self.thread.start()
+
+    def mark(self):
+        """Record an edit; it is saved once edits pause."""
+        with self.cond:
+            self.last = time.monotonic()
+            if self.first is None: self.first = self.last
+            if self.state != ERROR: self.state = PENDING
+            self.cond.notify_all()
+
+    def flush(self):
+        """Save any pending edits now and wait until they are on disk (or failed)."""
+        with self.cond:
+            self.urgent = True
+            self.cond.notify_all()
+            while (self.first is not None or self.state == SAVING) and self.thread.is_alive():
+                self.cond.wait(0.1)
+            self.urgent = False
+        return self.error if self.state == ERROR else None
+
+    def close(self):
+        """Flush, then stop the thread."""
+        err = self.flush()
+        with self.cond:
+            self.closed = True
+            self.cond.notify_all()
+        self.thread.join()
+        return err
+
+    def _due(self):
+        return min(self.last + self.delay, self.first + self.max_delay)
+
+    def _run(self):
+        with self.cond:
+            while True:
+                while self.first is None and not self.closed:
+                    self.cond.wait()
+                if self.first is None: return  # closed with nothing pending
+                # Let the burst finish, unless someone is waiting on a flush
+                while not (self.urgent or self.closed):
+                    wait = self._due() - time.monotonic()
+                    if wait <= 0: break
+                    self.cond.wait(wait)
+                self.first = None
+                self.state = SAVING
+                self.cond.release()
+                try:
+                    self.write()
+                    err = None
+                except Exception as e:  # keep the thread alive; try again later
+                    err = e
+                finally:
+                    self.cond.acquire()
+                if err is not None:
+                    self.error, self.state = err, ERROR
+                    if self.first is None and not self.urgent:
+                        self.first = self.last = time.monotonic()  # retry after a delay
+                else:
+                    self.error = None
+                    self.state = SAVED if self.first is None else PENDING
+                self.cond.notify_all()
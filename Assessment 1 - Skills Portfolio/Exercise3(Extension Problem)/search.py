@@ -0,0 +1,120 @@
+"""Search-as-you-type over student codes and names.
+
+Names are indexed once per distinct name, not once per student, since a
+class of 10^6 repeats plenty of them. Every three-letter piece (trigram)
+of a name maps to the names that contain it, and so do the first one and
+two letters of every word. A query of three or more letters looks up its
+rarest trigram and checks just those names, so it matches anywhere in
+the name. A shorter query matches the start of a word. Digits also match
+the start of a code, found by bisecting a sorted array of codes. New
+codes wait in an unsorted array until the next code search sorts them
+in, so adding a whole file a batch at a time stays linear.
+
+Name matches come back sorted by name, and in the order they were added
+within a name, followed by code matches in code order.
+"""
+from array import array
+from bisect import bisect_left, insort
+from operator import itemgetter
+
+INSORT_MAX = 64  # new codes put in one by one; more than this are merged by a sort
+
+
+def _norm(text):
+    return " ".join(text.lower().split())
+
+
+def _grams(name):
+    grams = {name[i:i + 3] for i in range(len(name) - 2)}
+    for word in name.split():
+        grams.add(word[:1]); grams.add(word[:2])
+    return grams
+
+
+class SearchIndex:
+    """Maps part of a code or name to the students that have it."""
+    def __init__(self, students=()):
+        self.codes = array("q")  # slot -> code
+        self.names = []          # name id -> lower-case name
+        self.name_id = {}        # lower-case name -> name id
+        self.name_slots = []     # name id -> live slots with that name
+        self.postings = {}       # trigram or word prefix -> array of name ids
+        self.sorted_codes = array("q")  # live codes, sorted
+        self.new_codes = array("q")     # live codes added since, not sorted in yet
+        self.count = 0
+        for s in students:
+            self.add(s.code, s.name)
+
+    def __len__(self):
+        return self.count
+
+    def add(self, code, name):
+        slot = len(self.codes)
+        self.codes.append(code)
+        self.new_codes.append(code)
+        self.count += 1
+        name = _norm(name)
+        nid = self.name_id.get(name)
+        if nid is None:
+            nid = self.name_id[name] = len(self.names)
+            self.names.append(name)
+            self.name_slots.append([])
+            postings = self.postings
+            for g in _grams(name):
+                p = postings.get(g)
+                if p is None: p = postings[g] = array("I")
+                p.append(nid)
+        self.name_slots[nid].append(slot)
+
+    def remove(self, code, name):
+        nid = self.name_id.get(_norm(name))
+        if nid is None: return
+        slots = self.name_slots[nid]
+        for i, slot in enumerate(slots):
+            if self.codes[slot] == code:
+                del slots[i]
+                sc = self.sorted_codes
+                j = bisect_left(sc, code)
+                if j < len(sc) and sc[j] == code: del sc[j]
+                else: self.new_codes.remove(code)
+                self.count -= 1
+                return
+
+    def find(self, text):
+        """Codes of the students whose name contains text, then those whose code starts with it."""
+        q = _norm(text)
+        if not q: return array("q")
+        if len(q) < 3:
+            nids = self.postings.get(q, ())
+        else:
+            grams = [q[i:i + 3] for i in range(len(q) - 2)]
+            rarest = min((self.postings.get(g, ()) for g in grams), key=len)
+            nids = [n for n in rarest if q in self.names[n]]
+        slots = []
+        for n in sorted(nids, key=self.names.__getitem__):
+            slots.extend(self.name_slots[n])
+        out = array("q", itemgetter(*slots)(self.codes) if len(slots) > 1 else
+                    [self.codes[s] for s in slots])
+        if q.isdigit(): out.extend(self._code_prefix(q))
+        return out
+
+    def _sort_codes(self):
+        new = self.new_codes
+        if len(new) <= INSORT_MAX:
+            for code in new: insort(self.sorted_codes, code)
+        else:
+            # sort() spots the part that is already in order, so this is close to a merge
+            self.sorted_codes = array("q", sorted(self.sorted_codes + new))
+        self.new_codes = array("q")
+
+    def _code_prefix(self, q):
+        # Codes starting with q lie in [q, q+1), [q0, q0+10), ... up to the widest code
+        if self.new_codes: self._sort_codes()
+        sc = self.sorted_codes
+        if not sc or (q[0] == "0" and q != "0"): return
+        lo, hi = int(q), int(q) + 1
+        top = max(abs(sc[0]), abs(sc[-1]))
+        while lo <= top:
+            yield from sc[bisect_left(sc, lo):bisect_left(sc, hi)]
+            if lo == 0: break  # "0" only matches the code 0
+            lo, hi = lo * 10, hi * 10
@@ -0,0 +1,143 @@
+"""Noticing when the marks file is changed by another program.
+
+FileWatcher compares the file's mtime, size and inode on every poll. On
+Linux it also watches the folder through inotify, and a poll with no
+inotify event doesn't stat the file at all. A change is only reported
+once two polls in a row see the same state, so a file that is still being
+written is not picked up half-way.
+
+fingerprint() and appended_since() let the manager tell "rows were added
+at the end" apart from any other edit without parsing the old rows again.
+"""
+import ctypes
+import os
+import struct
+import zlib
+from collections import namedtuple
+
+BLOCK = 1 << 20  # bytes read at a time when checksumming
+
+# inotify(7) event bits
+IN_MODIFY, IN_CLOSE_WRITE, IN_MOVED_TO, IN_CREATE, IN_DELETE = 0x2, 0x8, 0x80, 0x100, 0x200
+IN_Q_OVERFLOW = 0x4000
+EVENT = struct.Struct("iIII")  # wd, mask, cookie, name length
+
+
+def file_stamp(path):
+    """(mtime_ns, size, inode) of path, or None if it is missing."""
+    try: st = os.stat(path)
+    except FileNotFoundError: return None
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
+# ------------------ Fingerprints ------------------
+# body is where the rows start (after any count header); crc covers body to the end.
+Fingerprint = namedtuple("Fingerprint", "stamp body size crc")
+
+
+def _body_start(f):
+    # Same rule as the loaders: the first non-blank line is a header if it is a bare number
+    while True:
+        start = f.tell()
+        line = f.readline()
+        if not line: return start
+        if line.strip(): return f.tell() if line.strip().isdigit() else start
+
+
+def _crc(f, n):
+    crc = 0
+    while n > 0:
+        block = f.read(min(BLOCK, n))
+        if not block: break
+        crc = zlib.crc32(block, crc)
+        n -= len(block)
+    return crc
+
+
+def fingerprint(path, body=True):
+    """Fingerprint of a marks file; with body=False only the stamp is taken."""
+    stamp = file_stamp(path)
+    if stamp is None or not body:
+        return Fingerprint(stamp, None, None, None)
+    with open(path, "rb") as f:
+        start = _body_start(f)
+        return Fingerprint(stamp, start, stamp[1] - start, _crc(f, stamp[1] - start))
+
+
+def appended_since(path, fp):
+    """Offset of the new rows if path is fp's file with rows added at the end, else None.
+
+    The count header may have changed; every old row must still be there,
+    byte for byte, straight after it.
+    """
+    if fp is None or fp.crc is None: return None
+    with open(path, "rb") as f:
+        start = _body_start(f)
+        size = os.fstat(f.fileno()).st_size
+        if size - start <= fp.size: return None
+        if _crc(f, fp.size) != fp.crc: return None
+        # The old file must have ended on a line break, or its last row has grown
+        if fp.size:
+            f.seek(start + fp.size - 1)
+            if f.read(1) != b"\n": return None
+        return start + fp.size
+
+
+# ------------------ Watching ------------------
+class _Inotify:
+    """inotify on the file's folder (so atomic renames are seen), read without blocking."""
+    def __init__(self, path):
+        libc = ctypes.CDLL(None, use_errno=True)
+        self.fd = libc.inotify_init1(os.O_NONBLOCK)
+        if self.fd < 0: raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        folder = os.path.dirname(os.path.abspath(path))
+        mask = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+        if libc.inotify_add_watch(self.fd, os.fsencode(folder), mask) < 0:
+            os.close(self.fd)
+            raise OSError(ctypes.get_errno(), "inotify_add_watch failed")
+        self.name = os.fsencode(os.path.basename(path))
+
+    def pending(self):
+        """True if the file was touched since the last call."""
+        hit = False
+        while True:
+            try: data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError: return hit
+            pos = 0
+            while pos < len(data):
+                _, mask, _, n = EVENT.unpack_from(data, pos)
+                name = data[pos + EVENT.size:pos + EVENT.size + n].rstrip(b"\0")
+                if name == self.name or mask & IN_Q_OVERFLOW: hit = True
+                pos += EVENT.size + n
+
+    def close(self):
+        os.close(self.fd)
+
+
+class FileWatcher:
+    """Reports changes to one file, once they have settled; call poll() regularly."""
+    def __init__(self, path, use_inotify=True):
+        self.path = path
+        self.seen = file_stamp(path)
+        self.settling = None  # stamp seen by the last poll, while a change settles
+        self.inotify = None
+        if use_inotify:
+            try: self.inotify = _Inotify(path)
+            except (OSError, AttributeError): pass  # not Linux, or out of watches
+
+    def poll(self):
+        """True once after the file has changed and then stayed the same for a poll."""
+        if self.inotify and not self.inotify.pending() and self.settling is None:
+            return False
+        now = file_stamp(self.path)
+        if now == self.seen or now is None:
+            self.settling = None
+            return False
+        if now != self.settling:
+            self.settling = now  # still changing, or first sight; look again next poll
+            return False
+        self.seen, self.settling = now, None
+        return True
+
+    def close(self):
+        if self.inotify: self.inotify.close(); self.inotify = None
@@ -1,70 +1,23 @@
 import tkinter as tk
-from tkinter import messagebox, simpledialog
+from tkinter import messagebox, simpledialog, ttk
+import argparse
 import os
+from itertools import islice
 
-# ------------------ Student ------------------
-class Student:
-    def __init__(self, code, name, c1, c2, c3, exam):
-        self.code = int(code)
-        self.name = name
-        self.c1 = int(c1); self.c2 = int(c2); self.c3 = int(c3)
-        self.exam = int(exam)
-
-    def cw(self): return self.c1 + self.c2 + self.c3
-    def total(self): return self.cw() + self.exam
-    def pct(self): return round((self.total() / 160) * 100, 2)
-
-    def grade(self):
-        p = self.pct()
-        if p >= 70: return "A"
-        if p >= 60: return "B"
-        if p >= 50: return "C"
-        if p >= 40: return "D"
-        return "F"
-
-    def format(self):
-        return (f"Name: {self.name}\n"
-                f"Code: {self.code}\n"
-                f"Coursework: {self.cw()}/60\n"
-                f"Exam: {self.exam}/100\n"
-                f"Total: {self.total()}/160\n"
-                f"Percentage: {self.pct()}%\n"
-                f"Grade: {self.grade()}\n")
-
-# ------------------ Manager ------------------
-class StudentManager:
-    def __init__(self, path):
-        self.path = path
-        self.students = []
-        self.load()
-
-    def load(self):
-        if not os.path.exists(self.path):
-            messagebox.showerror("Error", f"File not found: {self.path}")
-            return
-
-        with open(self.path, "r", encoding="utf-8") as f:
-            lines = [l.strip() for l in f.readlines() if l.strip()]
-
-        if not lines: return
+from student_data import StudentManager
+from tk_widgets import BackgroundLoader, VirtualList
 
-        # Skip first line (number of students)
-        data = lines[1:] if lines[0].isdigit() else lines
-        for ln in data:
-            parts = ln.split(",")
-            if len(parts) == 6:
-                self.students.append(Student(*parts))
-
-    def by_code(self, code):
-        for s in self.students:
-            if s.code == code: return s
-        return None
+PAGE_SIZE = 200  # Students per "View All" page
+CHUNK = 25       # Students rendered per idle callback
 
 # ------------------ App ------------------
 class App:
     def __init__(self, root, manager):
         self.root = root
         self.m = manager
+        self.page = 0          # current "View All" page
+        self.report_avg = 0.0  # average shown in the "View All" footer
+        self.stream = None     # pending after_idle id while a page renders
 
         root.title("Student Manager")
         root.geometry("850x500")
@@ -81,15 +34,29 @@ class App:
         left = tk.Frame(main, bg="#f2f2f2")
         left.pack(side="left", fill="y")
         tk.Label(left, text="Students", font=("Segoe UI", 12, "bold"), bg="#f2f2f2").pack(anchor="w")
-        self.listbox = tk.Listbox(left, width=32, height=23, font=("Segoe UI", 10))
+        self.listbox = VirtualList(left, lambda: self.m.students,
+                                   lambda s: f"{s.code} - {s.name}",
+                                   command=self.select_student,
+                                   width=32, height=23, font=("Segoe UI", 10))
         self.listbox.pack()
-        self.listbox.bind("<<ListboxSelect>>", self.select_student)
         self.refresh_listbox()
 
         # RIGHT: Output
         right = tk.Frame(main, bg="#f2f2f2")
         right.pack(side="right", fill="both", expand=True)
         tk.Label(right, text="Output", font=("Segoe UI", 12, "bold"), bg="#f2f2f2").pack(anchor="w")
+        # Page controls for "View All"
+        nav = tk.Frame(right, bg="#f2f2f2")
+        nav.pack(side="bottom", fill="x", pady=(4, 0))
+        self.prev_btn = tk.Button(nav, text="< Prev", width=8, state="disabled",
+                                  command=lambda: self.show_page(self.page - 1))
+        self.prev_btn.pack(side="left")
+        self.next_btn = tk.Button(nav, text="Next >", width=8, state="disabled",
+                                  command=lambda: self.show_page(self.page + 1))
+        self.next_btn.pack(side="right")
+        self.page_label = tk.Label(nav, text="", bg="#f2f2f2", font=("Segoe UI", 9))
+        self.page_label.pack()
+        self.progress = ttk.Progressbar(nav, length=160, maximum=1.0)  # shown while loading
         self.output = tk.Text(right, wrap="word", height=20, font=("Segoe UI", 10))
         self.output.pack(fill="both", expand=True)
 
@@ -98,27 +65,67 @@ class App:
         menu.pack(fill="x", pady=6)
         btn = dict(bg="#4c57ff", fg="white", font=("Segoe UI", 10, "bold"), width=20)
 
-        tk.Button(menu, text="View All", command=self.view_all, **btn).pack(side="left", padx=4)
-        tk.Button(menu, text="View Individual", command=self.view_single, **btn).pack(side="left", padx=4)
-        tk.Button(menu, text="Highest Score", command=self.view_highest, **btn).pack(side="left", padx=4)
-        tk.Button(menu, text="Lowest Score", command=self.view_lowest, **btn).pack(side="left", padx=4)
+        # These need every student, so they stay disabled while loading
+        self.data_buttons = []
+        for text, cmd in (("View All", self.view_all), ("View Individual", self.view_single),
+                          ("Highest Score", self.view_highest), ("Lowest Score", self.view_lowest)):
+            b = tk.Button(menu, text=text, command=cmd, **btn)
+            b.pack(side="left", padx=4)
+            self.data_buttons.append(b)
 
     # ---------------- Utils ----------------
     def write(self, txt):
+        self._stop_stream()
+        self.set_pager(False)
         self.output.config(state="normal")
         self.output.delete("1.0", "end")
         self.output.insert("end", txt)
         self.output.config(state="disabled")
 
+    def append(self, txt):
+        self.output.config(state="normal")
+        self.output.insert("end", txt)
+        self.output.config(state="disabled")
+
+    def set_pager(self, on, pages=1):
+        self.prev_btn.config(state="normal" if on and self.page > 0 else "disabled")
+        self.next_btn.config(state="normal" if on and self.page < pages - 1 else "disabled")
+        self.page_label.config(text=f"Page {self.page + 1} / {pages}" if on else "")
+
+    def _stop_stream(self):
+        if self.stream: self.root.after_cancel(self.stream); self.stream = None
+
+    def _stream(self, blocks, footer):
+        # Append CHUNK students now and queue the rest for when Tk is idle
+        chunk = "".join(islice(blocks, CHUNK))
+        if chunk:
+            self.append(chunk)
+            self.stream = self.root.after_idle(self._stream, blocks, footer)
+        else:
+            self.append(footer)
+            self.stream = None
+
     def refresh_listbox(self):
-        self.listbox.delete(0, "end")
-        for s in self.m.students:
-            self.listbox.insert("end", f"{s.code} - {s.name}")
+        self.listbox.refresh()
+
+    def set_loading(self, frac):
+        """Show load progress (0-1) with the data buttons locked; None when done."""
+        loading = frac is not None
+        for b in self.data_buttons:
+            b.config(state="disabled" if loading else "normal")
+        if loading:
+            self.progress["value"] = frac
+            if not self.progress.winfo_manager(): self.progress.pack(side="left", padx=8)
+            self.page_label.config(text=f"Loading students... {len(self.m.students):,} ({frac:.0%})")
+        else:
+            self.progress.pack_forget()
+            self.page_label.config(text="")
+        self.refresh_listbox()
 
     # ---------------- Features ----------------
     def select_student(self, e=None):
-        try: idx = self.listbox.curselection()[0]
-        except: return
+        idx = self.listbox.selected()
+        if idx is None: return
         s = self.m.students[idx]
         self.write(s.format())
 
@@ -126,14 +133,21 @@ class App:
         if not self.m.students:
             self.write("No student records available.")
             return
-        out = ""
-        total_pct = 0
-        for s in self.m.students:
-            out += s.format() + "-"*40 + "\n"
-            total_pct += s.pct()
-        avg = round(total_pct / len(self.m.students), 2)
-        out += f"\nTotal Students: {len(self.m.students)}\nAverage Percentage: {avg}%"
-        self.write(out)
+        self.report_avg = round(sum(s.pct() for s in self.m.students) / len(self.m.students), 2)
+        self.show_page(0)
+
+    def show_page(self, page):
+        students = self.m.students
+        n = len(students)
+        pages = max(1, -(-n // PAGE_SIZE))
+        self.page = max(0, min(page, pages - 1))
+        start = self.page * PAGE_SIZE
+        blocks = (students[i].format() + "-"*40 + "\n"
+                  for i in range(start, min(n, start + PAGE_SIZE)))
+        footer = f"\nTotal Students: {n}\nAverage Percentage: {self.report_avg}%"
+        self.write("")
+        self.set_pager(True, pages)
+        self._stream(blocks, footer)
 
     def view_single(self):
         code = simpledialog.askinteger("Find Student", "Enter student code:")
@@ -155,11 +169,15 @@ class App:
         self.write("Lowest Scoring Student:\n\n" + s.format())
 
 # ---------------- Main ----------------
-def main():
-    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "studentMarks.txt")
-    mgr = StudentManager(path)
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Student Manager")
+    ap.add_argument("path", nargs="?",
+                    default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "studentMarks.txt"),
+                    help="marks file: studentMarks.txt format, or SQLite (.db/.sqlite)")
+    args = ap.parse_args(argv)
     root = tk.Tk()
-    App(root, mgr)
+    app = App(root, StudentManager(args.path, autoload=False))
+    BackgroundLoader(app)
     root.mainloop()
 
 if __name__ == "__main__":
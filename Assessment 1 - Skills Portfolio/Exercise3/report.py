@@ -0,0 +1,151 @@
+"""Headless batch reports for studentMarks.txt files; no tkinter needed.
+
+    python report.py studentMarks.txt [more.txt more.db ...] \\
+        [--format csv|json] [--rows rows.csv] [--summary summary.csv]
+
+Every file is streamed one student at a time and nothing is kept per
+student: the per-student rows are written as they are read, and the
+summary only keeps a count per total (0-160), from which the mean, median,
+percentiles and grade counts are worked out. Memory use stays the same
+however large the files are. Rows go to stdout unless --rows is given;
+the summary goes to stderr unless --summary is given. With --format json
+the rows are JSON Lines and the summary is one JSON document.
+"""
+import argparse
+import csv
+import json
+import math
+import sys
+from collections import Counter
+
+from student_data import PCT, _grade, iter_students
+
+ROW_FIELDS = ("file", "code", "name", "c1", "c2", "c3", "exam", "cw", "total", "pct", "grade")
+PERCENTILES = (10, 25, 50, 75, 90)
+GRADES = "ABCDF"
+SUMMARY_FIELDS = ("file", "count", "mean_pct", "median_pct",
+                  *(f"p{q}_pct" for q in PERCENTILES if q != 50),
+                  "min_pct", "max_pct", *(f"grade_{g}" for g in GRADES))
+
+
+# ------------------ Pipeline ------------------
+def student_rows(paths):
+    """Yield (path, Student) for every student in every file, in order."""
+    for path in paths:
+        for s in iter_students(path):
+            yield path, s
+
+
+def as_record(path, s):
+    return {"file": path, "code": s.code, "name": s.name, "c1": s.c1, "c2": s.c2,
+            "c3": s.c3, "exam": s.exam, "cw": s.cw(), "total": s.total(),
+            "pct": s.pct(), "grade": s.grade()}
+
+
+def tally(pairs, stats):
+    """Pass (path, Student) pairs through, counting totals per file into stats."""
+    for path, s in pairs:
+        stats.setdefault(path, Counter())[s.total()] += 1
+        yield path, s
+
+
+# ------------------ Summary ------------------
+def pct_of(total):
+    return PCT[total] if 0 <= total <= 160 else round((total / 160) * 100, 2)
+
+
+def nearest_rank(hist, n, q):
+    """Total at percentile q (nearest-rank) of a {total: count} histogram of n students."""
+    rank = max(1, math.ceil(q / 100 * n))
+    seen = 0
+    for t in sorted(hist):
+        seen += hist[t]
+        if seen >= rank: return t
+
+
+def summarise(name, hist):
+    n = sum(hist.values())
+    row = {"file": name, "count": n}
+    if not n:
+        return row
+    totals = sorted(hist)
+    row["mean_pct"] = round(sum(pct_of(t) * c for t, c in hist.items()) / n, 2)
+    row["min_pct"] = pct_of(totals[0])
+    row["max_pct"] = pct_of(totals[-1])
+    for q in PERCENTILES:
+        key = "median_pct" if q == 50 else f"p{q}_pct"
+        row[key] = pct_of(nearest_rank(hist, n, q))
+    grades = Counter()
+    for t, c in hist.items():
+        grades[_grade(pct_of(t))] += c
+    for g in GRADES:
+        row[f"grade_{g}"] = grades[g]
+    return {k: row[k] for k in SUMMARY_FIELDS}
+
+
+def summary_rows(stats):
+    """One row per file, then an "ALL" row across every file."""
+    everything = Counter()
+    for path, hist in stats.items():
+        everything.update(hist)
+        yield summarise(path, hist)
+    if len(stats) > 1:
+        yield summarise("ALL", everything)
+
+
+# ------------------ Output ------------------
+def write_rows(pairs, out, fmt):
+    if fmt == "json":
+        for path, s in pairs:
+            out.write(json.dumps(as_record(path, s)) + "\n")
+        return
+    w = csv.DictWriter(out, ROW_FIELDS)
+    w.writeheader()
+    for path, s in pairs:
+        w.writerow(as_record(path, s))
+
+
+def write_summary(rows, out, fmt):
+    if fmt == "json":
+        json.dump(list(rows), out, indent=2)
+        out.write("\n")
+        return
+    w = csv.DictWriter(out, SUMMARY_FIELDS)
+    w.writeheader()
+    w.writerows(rows)
+
+
+def _open(path, default):
+    return open(path, "w", newline="", encoding="utf-8") if path else default
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("files", nargs="+", help="marks files (studentMarks.txt format or SQLite)")
+    ap.add_argument("--format", choices=("csv", "json"), default="csv")
+    ap.add_argument("--rows", help="write per-student rows here (default: stdout)")
+    ap.add_argument("--no-rows", action="store_true", help="only produce the summary")
+    ap.add_argument("--summary", help="write the summary here (default: stderr)")
+    args = ap.parse_args(argv)
+
+    stats = {path: Counter() for path in args.files}
+    pairs = tally(student_rows(args.files), stats)
+    try:
+        if args.no_rows:
+            for _ in pairs: pass
+        else:
+            out = _open(args.rows, sys.stdout)
+            try: write_rows(pairs, out, args.format)
+            finally:
+                if out is not sys.stdout: out.close()
+    except FileNotFoundError as e:
+        ap.exit(1, f"report.py: {e}\n")
+
+    out = _open(args.summary, sys.stderr)
+    try: write_summary(summary_rows(stats), out, args.format)
+    finally:
+        if out is not sys.stderr: out.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""Student data for the Student Manager, with no tkinter dependency.
+
+Exercise3.py builds its window on top of this module, and report.py uses
+it for headless batch reports.
+"""
+import os
+import sqlite3
+
+BATCH_SIZE = 5000  # Students per batch when loading in the background
+
+# ------------------ Student ------------------
+def _grade(p):
+    if p >= 70: return "A"
+    if p >= 60: return "B"
+    if p >= 50: return "C"
+    if p >= 40: return "D"
+    return "F"
+
+# Percentage and grade only depend on the total (0-160), so precompute them
+PCT = [round((t / 160) * 100, 2) for t in range(161)]
+GRADE = [_grade(p) for p in PCT]
+
+class Student:
+    """One student's marks.
+
+    Uses __slots__ and works out cw/total/pct/grade once, when the marks
+    are built. A Student in a manager is read-only: to change marks, delete
+    it and add a new one so the manager's code index stays in step.
+    """
+    __slots__ = ("code", "name", "c1", "c2", "c3", "exam", "_cw", "_total", "_pct", "_grade")
+
+    def __init__(self, code, name, c1, c2, c3, exam):
+        self.code = int(code)
+        self.name = name
+        self.c1 = int(c1); self.c2 = int(c2); self.c3 = int(c3)
+        self.exam = int(exam)
+        self._derive()
+
+    def _derive(self):
+        self._cw = cw = self.c1 + self.c2 + self.c3
+        self._total = t = cw + self.exam
+        if 0 <= t <= 160:
+            self._pct = PCT[t]; self._grade = GRADE[t]
+        else:
+            self._pct = round((t / 160) * 100, 2); self._grade = _grade(self._pct)
+
+    def cw(self): return self._cw
+    def total(self): return self._total
+    def pct(self): return self._pct
+    def grade(self): return self._grade
+
+    def format(self):
+        return (f"Name: {self.name}\n"
+                f"Code: {self.code}\n"
+                f"Coursework: {self.cw()}/60\n"
+                f"Exam: {self.exam}/100\n"
+                f"Total: {self.total()}/160\n"
+                f"Percentage: {self.pct()}%\n"
+                f"Grade: {self.grade()}\n")
+
+# ------------------ SQLite storage ------------------
+# Marks can also live in a SQLite file (.db/.sqlite) with an index on code.
+# The Extension app creates these and converts to and from studentMarks.txt.
+SQLITE_EXTS = (".db", ".sqlite", ".sqlite3")
+
+def is_sqlite(path):
+    return os.path.splitext(path)[1].lower() in SQLITE_EXTS
+
+def read_db(path):
+    """Yield (code, name, c1, c2, c3, exam) rows from a SQLite marks file, in file order."""
+    con = sqlite3.connect(path)
+    try:
+        yield from con.execute("SELECT code, name, c1, c2, c3, exam FROM students ORDER BY pos")
+    finally:
+        con.close()
+
+# ------------------ Reading ------------------
+def _read_with_progress(path):
+    """Yield (Student, fraction of the file read) for a text or SQLite marks file."""
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"File not found: {path}")  # sqlite3 would create it
+    if is_sqlite(path):
+        con = sqlite3.connect(path)
+        try: n = con.execute("SELECT COUNT(*) FROM students").fetchone()[0] or 1
+        finally: con.close()
+        for i, row in enumerate(read_db(path), 1):
+            yield Student(*row), i / n
+        return
+    total = os.path.getsize(path) or 1
+    done = 0
+    first = True
+    with open(path, "rb") as f:
+        for raw in f:
+            done += len(raw)
+            ln = raw.decode("utf-8").strip()
+            if not ln: continue
+            if first:
+                first = False
+                if ln.isdigit(): continue  # Skip first line (number of students)
+            parts = ln.split(",")
+            if len(parts) == 6:
+                yield Student(*parts), done / total
+
+def iter_students(path):
+    """Stream the students in a marks file one at a time, without keeping them."""
+    for s, _ in _read_with_progress(path):
+        yield s
+
+# ------------------ Manager ------------------
+class StudentManager:
+    def __init__(self, path, autoload=True):
+        self.path = path
+        self.students = []
+        self.index = {}  # code -> Student, for O(1) lookups
+        if autoload: self.load()
+
+    def load(self):
+        """Read the whole file; raises FileNotFoundError if it is missing."""
+        self.students = list(iter_students(self.path))
+        self.reindex()
+
+    def reindex(self):
+        # First occurrence wins, matching the old linear scan
+        self.index = {}
+        for s in self.students:
+            self.index.setdefault(s.code, s)
+
+    def by_code(self, code):
+        return self.index.get(code)
+
+    # ---------------- Background loading ----------------
+    def begin_load(self):
+        """Empty the manager before feeding it read_batches() via add_loaded()."""
+        self.students = []
+        self.index = {}
+
+    def read_batches(self, size=BATCH_SIZE):
+        """Yield (students, fraction done); only reads the file, so safe on a worker thread."""
+        batch = []
+        for s, frac in _read_with_progress(self.path):
+            batch.append(s)
+            if len(batch) >= size:
+                yield batch, frac
+                batch = []
+        yield batch, 1.0
+
+    def add_loaded(self, batch):
+        self.students.extend(batch)
+        for s in batch:
+            self.index.setdefault(s.code, s)
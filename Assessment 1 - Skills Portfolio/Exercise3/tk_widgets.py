@@ -0,0 +1,147 @@
+"""Tk widgets shared by Exercise3.py and the Extension Problem's app.
+
+VirtualList shows any indexable sequence in a Listbox that only holds the
+visible rows; BackgroundLoader fills a manager on a worker thread while
+the window is already up. Exercise3Extension.py imports this folder too.
+"""
+import tkinter as tk
+from tkinter import messagebox
+import queue
+import threading
+
+# ------------------ Virtual List ------------------
+class VirtualList(tk.Frame):
+    """A Listbox that only holds the rows currently on screen.
+
+    items() returns the sequence to show (anything with len() and indexing)
+    and label(item) the text for one row. Scrolling re-renders just the
+    visible window, so refresh() costs the same for 10 students or 10^6.
+    """
+    def __init__(self, parent, items, label, command=None, height=23, **kw):
+        super().__init__(parent, bg=parent["bg"])
+        self.items = items
+        self.label = label
+        self.command = command
+        self.height = height
+        self.top = 0      # index of the first visible record
+        self.sel = None   # index of the selected record
+
+        self.lb = tk.Listbox(self, height=height, activestyle="none",
+                             exportselection=False, **kw)
+        self.sb = tk.Scrollbar(self, orient="vertical", command=self.yview)
+        self.lb.pack(side="left", fill="y")
+        self.sb.pack(side="right", fill="y")
+
+        self.lb.bind("<<ListboxSelect>>", self._on_select)
+        self.lb.bind("<MouseWheel>", lambda e: self.scroll(-1 if e.delta > 0 else 1, "units"))
+        self.lb.bind("<Button-4>", lambda e: self.scroll(-1, "units"))
+        self.lb.bind("<Button-5>", lambda e: self.scroll(1, "units"))
+        self.lb.bind("<Up>", lambda e: self._step(-1))
+        self.lb.bind("<Down>", lambda e: self._step(1))
+        self.lb.bind("<Prior>", lambda e: self._step(-height))
+        self.lb.bind("<Next>", lambda e: self._step(height))
+
+    def refresh(self):
+        items = self.items()
+        n = len(items)
+        self.top = max(0, min(self.top, n - self.height))
+        if self.sel is not None and self.sel >= n: self.sel = None
+        rows = []
+        for i in range(self.top, min(n, self.top + self.height)):
+            try: rows.append(self.label(items[i]))
+            except IndexError: break
+        self.lb.delete(0, "end")
+        self.lb.insert("end", *rows)
+        if self.sel is not None and self.top <= self.sel < self.top + len(rows):
+            self.lb.selection_set(self.sel - self.top)
+        if n: self.sb.set(self.top / n, min(1.0, (self.top + self.height) / n))
+        else: self.sb.set(0, 1)
+
+    def update_rows(self, rows):
+        """Re-render just these record indices, where they are on screen."""
+        items = self.items()
+        for i in rows:
+            j = i - self.top
+            if 0 <= j < self.lb.size():
+                self.lb.delete(j)
+                self.lb.insert(j, self.label(items[i]))
+                if i == self.sel: self.lb.selection_set(j)
+
+    def selected(self):
+        return self.sel
+
+    def see(self, i):
+        if i < self.top: self.top = i
+        elif i >= self.top + self.height: self.top = i - self.height + 1
+        self.refresh()
+
+    # ---------------- Scrolling ----------------
+    def yview(self, *args):
+        if args and args[0] == "moveto":
+            self.top = int(float(args[1]) * len(self.items()))
+            self.refresh()
+        elif args and args[0] == "scroll":
+            self.scroll(int(args[1]), args[2])
+
+    def scroll(self, n, what="units"):
+        self.top += n * (self.height if what == "pages" else 1)
+        self.refresh()
+
+    # ---------------- Selection ----------------
+    def _on_select(self, e=None):
+        cur = self.lb.curselection()
+        if not cur: return
+        self.sel = self.top + cur[0]
+        if self.command: self.command()
+
+    def _step(self, n):
+        last = len(self.items()) - 1
+        if last < 0: return "break"
+        self.sel = max(0, min(last, (self.sel if self.sel is not None else self.top - 1) + n))
+        self.see(self.sel)
+        if self.command: self.command()
+        return "break"
+
+# ------------------ Background Loader ------------------
+class BackgroundLoader:
+    """Reads the marks file on a worker thread while the window is already up.
+
+    The worker only parses; batches of Students reach the Tk thread through
+    a bounded queue that root.after drains a few batches at a time, so the
+    UI keeps painting and the worker can't run far ahead of it.
+    """
+    def __init__(self, app, poll=50, per_tick=4):
+        self.app = app
+        self.poll = poll
+        self.per_tick = per_tick
+        self.q = queue.Queue(maxsize=16)
+        self.frac = 0.0
+        app.m.begin_load()
+        app.set_loading(0.0)
+        threading.Thread(target=self._work, name="marks-loader", daemon=True).start()
+        app.root.after(poll, self._drain)
+
+    def _work(self):
+        try:
+            for batch, frac in self.app.m.read_batches():
+                self.q.put((batch, frac))
+            self.q.put((None, 1.0))
+        except Exception as e:
+            self.q.put((e, 1.0))
+
+    def _drain(self):
+        m = self.app.m
+        for _ in range(self.per_tick):
+            try: item, self.frac = self.q.get_nowait()
+            except queue.Empty: break
+            if item is None or isinstance(item, Exception):
+                self._finish(item); return
+            m.add_loaded(item)
+        self.app.set_loading(self.frac)
+        self.app.root.after(self.poll, self._drain)
+
+    def _finish(self, error):
+        if error is None: self.app.m.finish_load()
+        self.app.set_loading(None)
+        if error is not None:
+            messagebox.showerror("Error", f"Could not load {self.app.m.path}:\n{error}")
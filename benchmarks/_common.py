@@ -0,0 +1,68 @@
+"""Shared helpers for the benchmark scripts.
+
+The exercise folders are not packages (their names contain spaces), so the
+apps are imported straight from their file paths.
+"""
+import importlib.util
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                    "Assessment 1 - Skills Portfolio")
+EXERCISE3 = os.path.join(ROOT, "Exercise3", "Exercise3.py")
+STUDENT_DATA = os.path.join(ROOT, "Exercise3", "student_data.py")
+EXTENSION = os.path.join(ROOT, "Exercise3(Extension Problem)", "Exercise3Extension.py")
+EXERCISE1 = os.path.join(ROOT, "Exercise1", "Exercise1.py")
+QUESTIONS = os.path.join(ROOT, "Exercise1", "questions.py")
+QUIZ_SESSION = os.path.join(ROOT, "Exercise1", "quiz_session.py")
+
+FIRST = ["John", "Sam", "Lee", "Matt", "Ron", "Jake", "Jo", "Gareth", "Alan", "Les"]
+LAST = ["Curry", "Sturtivant", "Scott", "Thompson", "Herrema", "Hobbs", "Hyde",
+        "Southgate", "Shearer", "Ferdinand"]
+
+
+def load_module(path, name=None):
+    """Import a script by file path, with its folder on sys.path for siblings."""
+    folder = os.path.dirname(path)
+    if folder not in sys.path:
+        sys.path.insert(0, folder)
+    name = name or os.path.splitext(os.path.basename(path))[0]
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, path)
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules[name] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def write_marks(path, n, seed=0, chunk=100_000):
+    """Write a synthetic studentMarks.txt with n rows and unique codes.
+
+    Rows are generated a chunk at a time, so 10^7 rows take seconds
+    rather than minutes.
+    """
+    rnd = random.Random(seed)
+    names = [f"{a} {b}" for a in FIRST for b in LAST]
+    cw, exam = range(21), range(101)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(f"{n}\n")
+        for lo in range(0, n, chunk):
+            k = min(chunk, n - lo)
+            cols = (rnd.choices(names, k=k), rnd.choices(cw, k=k), rnd.choices(cw, k=k),
+                    rnd.choices(cw, k=k), rnd.choices(exam, k=k))
+            f.writelines(f"{1000 + lo + i},{nm},{a},{b},{c},{e}\n"
+                         for i, (nm, a, b, c, e) in enumerate(zip(*cols)))
+    return path
+
+
+def timeit(fn, repeat=1):
+    """Return the best wall-clock time of fn() over repeat runs, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        t = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t)
+    return best
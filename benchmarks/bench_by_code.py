@@ -0,0 +1,39 @@
+"""Compare the old linear by_code scan with the code -> Student index.
+
+    python benchmarks/bench_by_code.py --rows 1000000 --lookups 1000
+"""
+import argparse
+import os
+import random
+import tempfile
+
+from _common import EXERCISE3, EXTENSION, load_module, timeit, write_marks
+
+
+def linear(students, code):
+    for s in students:
+        if s.code == code: return s
+    return None
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--rows", type=int, default=10**6)
+    ap.add_argument("--lookups", type=int, default=1000)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_marks(os.path.join(tmp, "studentMarks.txt"), args.rows)
+        codes = [random.randrange(1000, 1000 + args.rows) for _ in range(args.lookups)]
+        for label, script in (("Exercise3", EXERCISE3), ("Extension", EXTENSION)):
+            m = load_module(script).StudentManager(path)
+            t_lin = timeit(lambda: [linear(m.students, c) for c in codes])
+            t_idx = timeit(lambda: [m.by_code(c) for c in codes], repeat=5)
+            print(f"{label:10} rows={args.rows:>9,} lookups={args.lookups}: "
+                  f"linear {t_lin / args.lookups * 1e6:10.1f} us/lookup, "
+                  f"index {t_idx / args.lookups * 1e6:6.2f} us/lookup "
+                  f"({t_lin / max(t_idx, 1e-9):,.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
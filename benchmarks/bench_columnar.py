@@ -0,0 +1,54 @@
+"""Compare the list-of-Student manager with the columnar backend.
+
+    python benchmarks/bench_columnar.py --rows 1000000
+"""
+import argparse
+import gc
+import os
+import tempfile
+import tracemalloc
+
+from _common import EXTENSION, load_module, timeit, write_marks
+
+
+def measure(cls, path):
+    gc.collect()
+    tracemalloc.start()
+    m = cls(path)
+    mem = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return m, mem
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--rows", type=int, default=10**6)
+    args = ap.parse_args()
+
+    ext = load_module(EXTENSION)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_marks(os.path.join(tmp, "studentMarks.txt"), args.rows)
+        results = {}
+        for label, cls in (("list", ext.StudentManager), ("columnar", ext.ColumnarStudentManager)):
+            load = timeit(lambda: cls(path))
+            m, mem = measure(cls, path)
+            results[label] = {
+                "load": load,
+                "memory": mem,
+                "average": timeit(m.average_pct, repeat=3),
+                "highest+lowest": timeit(lambda: (m.highest(), m.lowest()), repeat=3),
+                # Cleared each time so the order is built, not just looked up
+                "sort_total": timeit(lambda: (m.orders.clear(), m.ordered("total", reverse=True)[0])),
+            }
+            del m
+        print(f"rows={args.rows:,}")
+        for key in results["list"]:
+            a, b = results["list"][key], results["columnar"][key]
+            unit = "MB" if key == "memory" else "s"
+            scale = 1e6 if key == "memory" else 1
+            print(f"  {key:15} list {a / scale:9.3f} {unit}   columnar {b / scale:9.3f} {unit}"
+                  f"   ({a / max(b, 1e-9):.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
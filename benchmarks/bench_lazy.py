@@ -0,0 +1,35 @@
+"""Time opening a large marks file eagerly versus with the lazy mmap backend.
+
+    python benchmarks/bench_lazy.py --rows 1000000
+"""
+import argparse
+import os
+import tempfile
+
+from _common import EXTENSION, load_module, timeit, write_marks
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--rows", type=int, default=10**6)
+    args = ap.parse_args()
+
+    ext = load_module(EXTENSION)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_marks(os.path.join(tmp, "studentMarks.txt"), args.rows)
+        size = os.path.getsize(path) / 1e6
+        eager = timeit(lambda: ext.StudentManager(path))
+        lazy = ext.LazyStudentManager(path)
+        t_open = timeit(lambda: ext.LazyStudentManager(path).close(), repeat=5)
+        t_page = timeit(lambda: [lazy.students[i] for i in range(40)], repeat=5)
+        t_find = timeit(lambda: lazy.by_code(1000 + args.rows - 1), repeat=5)
+        lazy.close()
+        print(f"rows={args.rows:,} ({size:.1f} MB)")
+        print(f"  eager load          {eager * 1e3:10.2f} ms")
+        print(f"  lazy open           {t_open * 1e3:10.2f} ms")
+        print(f"  lazy first 40 rows  {t_page * 1e3:10.2f} ms")
+        print(f"  lazy by_code (last) {t_find * 1e3:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""Scaling of the multi-process marks parser with 1, 2, 4 and 8 workers.
+
+    python benchmarks/bench_parallel.py --rows 2000000
+
+Speed-ups are bounded by the number of CPU cores; with one core every
+worker count just adds process overhead.
+"""
+import argparse
+import os
+import tempfile
+
+from _common import EXTENSION, load_module, timeit, write_marks
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--rows", type=int, default=2 * 10**6)
+    ap.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = ap.parse_args()
+
+    ext = load_module(EXTENSION)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_marks(os.path.join(tmp, "studentMarks.txt"), args.rows)
+        print(f"rows={args.rows:,} cores={os.cpu_count()}")
+        serial = timeit(lambda: ext.ColumnarStudentManager(path))
+        print(f"  serial columnar load       {serial:7.2f} s")
+        for w in args.workers:
+            t = timeit(lambda: ext.ColumnarStudentManager(path, workers=w))
+            print(f"  workers={w}  columnar load  {t:7.2f} s  ({serial / t:4.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
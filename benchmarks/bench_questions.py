@@ -0,0 +1,38 @@
+"""Math Quiz question generation: one problem at a time versus make_quiz batches.
+
+    python benchmarks/bench_questions.py --count 1000000
+"""
+import argparse
+import random
+
+from _common import QUESTIONS, load_module, timeit
+
+
+def one_at_a_time(level, count, rnd):
+    # What Exercise1.displayProblem used to do for each question
+    lo, hi = {1: (0, 9), 2: (10, 99), 3: (1000, 9999)}[level]
+    out = []
+    for _ in range(count):
+        a, b, op = rnd.randint(lo, hi), rnd.randint(lo, hi), rnd.choice(["+", "-"])
+        if op == "-" and b > a: a, b = b, a
+        out.append((a, op, b, a + b if op == "+" else a - b))
+    return out
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--count", type=int, default=10**6)
+    args = ap.parse_args()
+
+    q = load_module(QUESTIONS)
+    n = args.count
+    print(f"problems={n:,}")
+    for level in sorted(q.LEVELS):
+        old = timeit(lambda: one_at_a_time(level, n, random.Random(0)))
+        new = timeit(lambda: q.make_quiz(level, n, 0), repeat=3)
+        print(f"  level {level}  one at a time {n / old / 1e6:6.2f} M/s   "
+              f"make_quiz {n / new / 1e6:6.2f} M/s  ({old / new:4.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Many headless Math Quiz games in one process: set-up, play-through and memory.
+
+    python benchmarks/bench_sessions.py --sessions 10000
+"""
+import argparse
+import random
+import tracemalloc
+
+from _common import QUIZ_SESSION, load_module, timeit
+
+
+def play(sessions, rnd):
+    # Roughly two answers in three right, one in three wrong
+    for s in sessions:
+        while not s.finished:
+            c = s.correct_answer()
+            s.answer(c if rnd.random() < 0.66 else c + 1)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--sessions", type=int, default=10_000)
+    ap.add_argument("--level", type=int, default=2)
+    args = ap.parse_args()
+
+    qs = load_module(QUIZ_SESSION)
+    n = args.sessions
+    tracemalloc.start()
+    sessions = qs.QuizSession.many(args.level, n, seed=0)
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    t_many = timeit(lambda: qs.QuizSession.many(args.level, n, seed=0), repeat=3)
+    t_each = timeit(lambda: [qs.QuizSession(args.level, seed=i) for i in range(n)], repeat=3)
+    t_play = timeit(lambda: play(qs.QuizSession.many(args.level, n, seed=0), random.Random(0)))
+    print(f"sessions={n:,} level={args.level}")
+    print(f"  memory per session      {held / n:10.0f} bytes")
+    print(f"  QuizSession.many        {n / t_many:10,.0f} sessions/s")
+    print(f"  one QuizSession each    {n / t_each:10,.0f} sessions/s")
+    print(f"  set up + play through   {n / t_play:10,.0f} sessions/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Math Quiz startup with a cold versus a warm background cache.
+
+    python benchmarks/bench_startup.py --runs 5
+
+Each run launches Exercise1.py in a fresh process with MATH_QUIZ_TIMING=exit.
+The app prints when its first frame was drawn and when the background
+appeared, then quits. The first run has an empty cache (Pillow decodes and
+resizes background.png); the rest reuse the cached PPM. Without a display
+the app cannot start, so the script falls back to timing just the image
+step in a fresh interpreter: decoding with Pillow versus reading the
+cache file.
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+
+from _common import EXERCISE1
+
+REPORT = re.compile(r"first frame ([\d.]+) ms, background ([\d.]+) ms \((.+)\)")
+
+# The image step alone, as bg_cache.load_background does it, minus Tk
+HEADLESS = """
+import os, sys, time
+t = time.perf_counter()
+sys.path.insert(0, {folder!r})
+import bg_cache
+src = os.path.join({folder!r}, "background.png")
+path = bg_cache.cache_path(src, (600, 480))
+if os.path.exists(path):
+    with open(path, "rb") as f: f.read()
+    how = "cache file read"
+else:
+    from PIL import Image
+    img = Image.open(src).convert("RGB").resize((600, 480), Image.LANCZOS)
+    bg_cache._store(img, path)
+    how = "Pillow decode + resize + store"
+print(f"{{(time.perf_counter() - t) * 1000:.1f}} {{how}}")
+"""
+
+
+def launch(env):
+    t = time.perf_counter()
+    p = subprocess.run([sys.executable, EXERCISE1], env=env, capture_output=True, text=True,
+                       timeout=60)
+    wall = (time.perf_counter() - t) * 1000
+    m = REPORT.search(p.stderr)
+    return (float(m[1]), float(m[2]), m[3], wall) if m else None
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--runs", type=int, default=5, help="launches; the first is cold")
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as cache:
+        env = dict(os.environ, MATH_QUIZ_TIMING="exit", MATH_QUIZ_CACHE=cache)
+        first = launch(env)
+        if first is not None:
+            print(f"{'run':6} {'first frame':>12} {'background':>11} {'process':>9}  image")
+            for i in range(args.runs):
+                frame, bg, how, wall = first if i == 0 else launch(env)
+                print(f"{'cold' if i == 0 else 'warm':6} {frame:9.1f} ms {bg:8.1f} ms "
+                      f"{wall:6.0f} ms  {how}")
+            return
+        print("Tk could not start (no display?); timing the image step only")
+        code = HEADLESS.format(folder=os.path.dirname(EXERCISE1))
+        for i in range(args.runs):
+            out = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True,
+                                 text=True, check=True).stdout.split(maxsplit=1)
+            print(f"  {'cold' if i == 0 else 'warm'}  {float(out[0]):8.1f} ms  {out[1].strip()}")
+
+
+if __name__ == "__main__":
+    main()
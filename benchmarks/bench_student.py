@@ -0,0 +1,78 @@
+"""Memory and throughput of the original Student class versus the slotted one.
+
+    python benchmarks/bench_student.py --count 1000000
+"""
+import argparse
+import gc
+import random
+import tracemalloc
+
+from _common import EXTENSION, STUDENT_DATA, load_module, timeit
+
+
+class OldStudent:
+    """The Student class as it was before __slots__ and cached values."""
+    def __init__(self, code, name, c1, c2, c3, exam):
+        self.code = int(code)
+        self.name = name
+        self.c1 = int(c1); self.c2 = int(c2); self.c3 = int(c3)
+        self.exam = int(exam)
+
+    def cw(self): return self.c1 + self.c2 + self.c3
+    def total(self): return self.cw() + self.exam
+    def pct(self): return round((self.total() / 160) * 100, 2)
+
+    def grade(self):
+        p = self.pct()
+        if p >= 70: return "A"
+        if p >= 60: return "B"
+        if p >= 50: return "C"
+        if p >= 40: return "D"
+        return "F"
+
+
+def fmt(s):
+    return (f"Name: {s.name}\nCode: {s.code}\nCoursework: {s.cw()}/60\n"
+            f"Exam: {s.exam}/100\nTotal: {s.total()}/160\n"
+            f"Percentage: {s.pct()}%\nGrade: {s.grade()}\n")
+
+
+def build(cls, rows):
+    return [cls(*r) for r in rows]
+
+
+def memory(cls, rows):
+    gc.collect()
+    tracemalloc.start()
+    objs = build(cls, rows)
+    mem = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objs
+    return mem
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--count", type=int, default=10**6)
+    args = ap.parse_args()
+
+    rnd = random.Random(0)
+    rows = [(str(1000 + i), "Jake Hobbs", str(rnd.randint(0, 20)), str(rnd.randint(0, 20)),
+             str(rnd.randint(0, 20)), str(rnd.randint(0, 100))) for i in range(args.count)]
+    classes = [("old", OldStudent),
+               ("Exercise3", load_module(STUDENT_DATA).Student),
+               ("Extension", load_module(EXTENSION).Student)]
+    print(f"instances={args.count:,}")
+    for label, cls in classes:
+        objs = build(cls, rows)
+        t_build = timeit(lambda: build(cls, rows))
+        t_fmt = timeit(lambda: [fmt(s) for s in objs])
+        t_agg = timeit(lambda: sum(s.pct() for s in objs), repeat=3)
+        mem = memory(cls, rows)
+        print(f"  {label:10} {mem / args.count:6.1f} B/student  build {t_build:6.2f} s  "
+              f"format {t_fmt:6.2f} s  sum(pct) {t_agg:6.3f} s")
+        del objs
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+"""Time the Student Manager's data paths and write the results as JSON.
+
+    python benchmarks/bench_suite.py --sizes 1e3,1e4,1e5 --out results.json
+    python benchmarks/bench_suite.py --sizes 1e3,1e4,1e5 --compare results.json
+
+For each size a synthetic studentMarks.txt is generated (or reused from
+--data), then every app/backend is timed on: load, save, by_code, the
+aggregates behind View All / Highest / Lowest, sort_total, and the UI
+handlers (listbox refresh, View All page render, Highest, Lowest, Sort by
+Total) under a hidden Tk root. UI timings are skipped, and recorded as
+such, when no display is available.
+
+Exercise3 has no save or sort, so those are only timed for the Extension.
+--compare reads an earlier results file, prints the ratio for every timing
+the two runs share, and exits with status 1 if any got slower than
+--tolerance allows.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+from _common import EXERCISE3, EXTENSION, ROOT, load_module, timeit, write_marks
+
+LOOKUPS = 1000  # by_code calls per timing
+MIN_TIME = 0.02  # fast calls are looped until a timing takes at least this long
+CASES = (("exercise3", "list"), ("extension", "list"), ("extension", "columnar"),
+         ("extension", "lazy"), ("extension", "sqlite"))
+
+
+# ------------------ Data ------------------
+def marks_file(folder, n, seed):
+    path = os.path.join(folder, f"marks_{n}_{seed}.txt")
+    if not os.path.exists(path):
+        write_marks(path, n, seed)
+    return path
+
+
+def sqlite_file(ext, txt):
+    db = os.path.splitext(txt)[0] + ".db"
+    if not os.path.exists(db):
+        ext.import_text(txt, db)
+    return db
+
+
+# ------------------ Timings ------------------
+def per_call(fn, repeat):
+    """Best time for one fn() call, looping fast calls so the clock can see them."""
+    calls = 1
+    while True:
+        t = timeit(lambda: [fn() for _ in range(calls)])
+        if t >= MIN_TIME or calls >= 1 << 20: break
+        calls *= 2
+    return timeit(lambda: [fn() for _ in range(calls)], repeat) / calls
+
+
+def data_timings(app, backend, mod, path, n, repeat):
+    """Yield (op, seconds) for the manager alone."""
+    if app == "exercise3":
+        make = lambda: mod.StudentManager(path)
+    else:
+        if backend == "sqlite": path = sqlite_file(mod, path)
+        make = lambda: mod.open_manager(path, backend)
+    yield "load", timeit(make, repeat)
+    m = make()
+
+    rnd = random.Random(1)
+    codes = [1000 + rnd.randrange(2 * n) for _ in range(LOOKUPS)]  # about half miss
+    yield "by_code", per_call(lambda: [m.by_code(c) for c in codes], repeat) / LOOKUPS
+
+    if app == "exercise3":
+        # The same expressions App.view_all/view_highest/view_lowest use
+        s = m.students
+        yield "average", per_call(lambda: round(sum(x.pct() for x in s) / len(s), 2), repeat)
+        yield "highest", per_call(lambda: max(s, key=lambda x: x.total()), repeat)
+        yield "lowest", per_call(lambda: min(s, key=lambda x: x.total()), repeat)
+    else:
+        yield "average", per_call(m.average_pct, repeat)
+        yield "highest", per_call(m.highest, repeat)
+        yield "lowest", per_call(m.lowest, repeat)
+        # Only the first sort by a key does any work; later ones reuse its index
+        yield "sort_total", timeit(lambda: m.ordered("total", reverse=True)[0])
+        yield "save", timeit(m.save, repeat)
+        m.close()
+
+
+def ui_timings(app, mod, m, tk_root, repeat):
+    """Yield (op, seconds) for the App handlers, in a withdrawn Toplevel."""
+    import tkinter as tk
+    top = tk.Toplevel(tk_root)
+    top.withdraw()
+    try:
+        a = mod.App(top, m)
+        top.update_idletasks()
+
+        def render_page():
+            a.view_all()
+            while a.stream: top.update_idletasks()
+
+        refresh = a.refresh_listbox if app == "exercise3" else a.refresh
+        yield "ui_listbox_refresh", timeit(lambda: (refresh(), top.update_idletasks()), repeat)
+        yield "ui_view_all", timeit(render_page, repeat)
+        yield "ui_view_highest", timeit(a.view_highest, repeat)
+        yield "ui_view_lowest", timeit(a.view_lowest, repeat)
+        if app == "extension":
+            yield "ui_sort_total", timeit(lambda: (a.sort_total(), top.update_idletasks()), repeat)
+    finally:
+        top.destroy()
+
+
+def hidden_root():
+    """A withdrawn Tk root, or (None, reason) if Tk cannot start here."""
+    try:
+        import tkinter as tk
+        root = tk.Tk()
+    except Exception as e:  # no tkinter, or no display
+        return None, str(e).splitlines()[0]
+    root.withdraw()
+    return root, None
+
+
+def run(sizes, apps, seed, repeat, folder, ui):
+    mods = {"exercise3": load_module(EXERCISE3), "extension": load_module(EXTENSION)}
+    tk_root, why = hidden_root() if ui else (None, "disabled with --no-ui")
+    results = []
+    for n in sizes:
+        path = marks_file(folder, n, seed)
+        for app, backend in CASES:
+            if app not in apps: continue
+            mod = mods[app]
+
+            def record(op, secs):
+                results.append({"app": app, "backend": backend, "rows": n,
+                                "op": op, "seconds": secs})
+                print(f"  {app:9} {backend:8} {n:>10,}  {op:20} "
+                      + ("skipped" if secs is None else f"{secs * 1e6:14.2f} us"), flush=True)
+
+            for op, secs in data_timings(app, backend, mod, path, n, repeat):
+                record(op, secs)
+            if backend != "list": continue  # the UI only sees the manager through its API
+            if tk_root is None:
+                record("ui", None)
+                continue
+            m = mod.StudentManager(path) if app == "exercise3" else mod.open_manager(path)
+            for op, secs in ui_timings(app, mod, m, tk_root, repeat):
+                record(op, secs)
+    if tk_root is not None: tk_root.destroy()
+    return results, why
+
+
+# ------------------ Output ------------------
+def git_commit():
+    try:
+        return subprocess.run(["git", "-C", ROOT, "rev-parse", "--short", "HEAD"],
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(old, new, tolerance):
+    """Print old/new ratios; return the timings that got slower than tolerance allows."""
+    key = lambda r: (r["app"], r["backend"], r["rows"], r["op"])
+    before = {key(r): r["seconds"] for r in old["results"] if r["seconds"]}
+    slower = []
+    for r in new["results"]:
+        a, b = before.get(key(r)), r["seconds"]
+        if not a or not b: continue
+        ratio = b / a
+        flag = "  SLOWER" if ratio > 1 + tolerance else ""
+        print(f"  {r['app']:9} {r['backend']:8} {r['rows']:>10,}  {r['op']:20} {ratio:6.2f}x{flag}")
+        if flag: slower.append(r)
+    return slower
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--sizes", default="1e3,1e4,1e5",
+                    help="comma-separated row counts, from 1e3 up to 1e7")
+    ap.add_argument("--apps", default="exercise3,extension")
+    ap.add_argument("--repeat", type=int, default=3, help="best of this many runs")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--data", help="keep generated marks files here (default: a temp dir)")
+    ap.add_argument("--no-ui", action="store_true", help="skip the Tk handler timings")
+    ap.add_argument("--out", default="bench_results.json")
+    ap.add_argument("--compare", metavar="OLD", help="earlier results file to compare against")
+    ap.add_argument("--tolerance", type=float, default=0.5,
+                    help="allowed slowdown before --compare fails (0.5 = 50%%)")
+    args = ap.parse_args()
+
+    sizes = [int(float(v)) for v in args.sizes.split(",")]
+    apps = set(args.apps.split(","))
+    started = time.time()
+    if args.data:
+        os.makedirs(args.data, exist_ok=True)
+        results, why = run(sizes, apps, args.seed, args.repeat, args.data, not args.no_ui)
+    else:
+        with tempfile.TemporaryDirectory() as tmp:
+            results, why = run(sizes, apps, args.seed, args.repeat, tmp, not args.no_ui)
+
+    doc = {
+        "meta": {"commit": git_commit(), "python": platform.python_version(),
+                 "platform": platform.platform(), "started": started,
+                 "seed": args.seed, "repeat": args.repeat, "lookups": LOOKUPS,
+                 "ui_skipped": why},
+        "results": results,
+    }
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(doc, f, indent=1)
+    print(f"Wrote {len(results)} timings to {args.out}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            old = json.load(f)
+        slower = compare(old, doc, args.tolerance)
+        if slower:
+            print(f"{len(slower)} timing(s) slower than {args.tolerance:.0%} over {args.compare}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
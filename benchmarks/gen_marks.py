@@ -0,0 +1,25 @@
+"""Write a synthetic studentMarks.txt for benchmarking.
+
+    python benchmarks/gen_marks.py --rows 1000000 --out big.txt [--seed 0]
+
+Codes are unique (1000 upwards), names are drawn from a small pool and the
+marks are uniform over their valid ranges. The same seed gives the same file.
+"""
+import argparse
+
+from _common import write_marks
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--rows", type=lambda v: int(float(v)), default=10**5,
+                    help="number of students, e.g. 1000 or 1e7")
+    ap.add_argument("--out", default="studentMarks.txt")
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+    write_marks(args.out, args.rows, args.seed)
+    print(f"Wrote {args.rows:,} students to {args.out}")
+
+
+if __name__ == "__main__":
+    main()